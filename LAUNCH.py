@@ -6,11 +6,34 @@ Double-click this file to run the tagger with an interactive menu.
 """
 
 import os
+import re
 import sys
+import json
+import argparse
+import time
+import atexit
+import sqlite3
+import hashlib
+import importlib.util
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import platform
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pynvml
+    PYNVML_AVAILABLE = True
+except ImportError:
+    PYNVML_AVAILABLE = False
+
 # Colors for different platforms
 if platform.system() == "Windows":
     # Windows color codes
@@ -31,16 +54,62 @@ else:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Models are cached next to the launcher so fresh checkouts that share the
+# directory don't download them again
+MODEL_CACHE_DIR = Path("model_cache")
+
+def use_model_cache():
+    """Point the Whisper/Hugging Face caches at MODEL_CACHE_DIR"""
+    MODEL_CACHE_DIR.mkdir(exist_ok=True)
+    cache_dir = str(MODEL_CACHE_DIR.resolve())
+    # openai-whisper stores models in $XDG_CACHE_HOME/whisper,
+    # faster-whisper in $HF_HOME/hub
+    os.environ.setdefault("XDG_CACHE_HOME", cache_dir)
+    os.environ.setdefault("HF_HOME", cache_dir)
+
+# ANSI "erase display" + "cursor home"; writing it avoids spawning a shell
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if platform.system() == 'Windows' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+HEADER = (
+    f"{CYAN}{'='*70}{RESET}\n"
+    f"{BOLD}{CYAN}🎤 Thai Speech-to-Text Auto-Tagger{RESET}\n"
+    f"{CYAN}{'='*70}{RESET}\n\n"
+)
 
 def print_header():
     """Print the application header"""
-    clear_screen()
-    print(f"{CYAN}{'='*70}{RESET}")
-    print(f"{BOLD}{CYAN}🎤 Thai Speech-to-Text Auto-Tagger{RESET}")
-    print(f"{CYAN}{'='*70}{RESET}\n")
+    sys.stdout.write(CLEAR_SCREEN + HEADER)
+    sys.stdout.flush()
+
+# (data dir mtime_ns, time listed, names) of the last MP3 listing
+_mp3_listing = (None, 0.0, [])
+
+def list_mp3s():
+    """
+    Names of the MP3 files in the data directory, sorted.
+    Reuses the previous listing for up to 2 seconds while the directory is
+    unchanged, so redrawing the menu after an action doesn't rescan it.
+    """
+    global _mp3_listing
+    try:
+        mtime_ns = os.stat("data").st_mtime_ns
+    except FileNotFoundError:
+        return []
+    
+    last_mtime, listed_at, names = _mp3_listing
+    if last_mtime == mtime_ns and time.monotonic() - listed_at < 2.0:
+        return names
+    
+    with os.scandir("data") as entries:
+        names = sorted(e.name for e in entries
+                       if e.is_file() and e.name.lower().endswith(".mp3"))
+    _mp3_listing = (mtime_ns, time.monotonic(), names)
+    return names
 
 def check_requirements():
     """Check if basic requirements are met"""
@@ -55,42 +124,169 @@ def check_requirements():
     if not Path("data").exists():
         warnings.append("'data' directory not found - will be created when needed")
     
-    # Check Python packages
-    try:
-        import numpy
-        import librosa
-    except ImportError as e:
-        errors.append(f"Missing required package: {e.name}")
+    # Check Python packages (find_spec only locates them; importing librosa
+    # here would add its full import time to every launch)
+    missing = [name for name in ("numpy", "librosa")
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        errors.append(f"Missing required package: {missing[0]}")
         errors.append("Run: pip install -r requirements.txt")
     
     return errors, warnings
 
-def print_menu():
-    """Display the main menu"""
-    print(f"{BOLD}Main Menu:{RESET}\n")
-    print(f"  {GREEN}1{RESET}) {BOLD}Process all files (FAST - no transcription){RESET}")
-    print(f"     ⚡ Quick audio analysis only (~1 second per file)")
-    print()
-    print(f"  {GREEN}2{RESET}) {BOLD}Process all files (FULL - with transcription){RESET}")
-    print(f"     🎯 Complete analysis with Thai transcription (~30-120s per file)")
-    print()
-    print(f"  {GREEN}3{RESET}) {BOLD}Process single file{RESET}")
-    print(f"     📄 Process one specific audio file")
-    print()
-    print(f"  {GREEN}4{RESET}) {BOLD}View quality statistics{RESET}")
-    print(f"     📊 Show summary of processed files")
-    print()
-    print(f"  {GREEN}5{RESET}) {BOLD}Export to CSV{RESET}")
-    print(f"     💾 Export metadata to spreadsheet format")
-    print()
-    print(f"  {GREEN}6{RESET}) {BOLD}Test installation{RESET}")
-    print(f"     🔧 Check if all dependencies are installed")
-    print()
-    print(f"  {GREEN}7{RESET}) {BOLD}Help & Documentation{RESET}")
-    print(f"     📖 View usage instructions")
-    print()
-    print(f"  {RED}0{RESET}) {BOLD}Exit{RESET}")
-    print()
+MENU = f"""{BOLD}Main Menu:{RESET}
+
+  {GREEN}1{RESET}) {BOLD}Process all files (FAST - no transcription){RESET}
+     ⚡ Quick audio analysis only (~1 second per file)
+
+  {GREEN}2{RESET}) {BOLD}Process all files (FULL - with transcription){RESET}
+     🎯 Complete analysis with Thai transcription (~30-120s per file)
+
+  {GREEN}3{RESET}) {BOLD}Process single file{RESET}
+     📄 Process one specific audio file
+
+  {GREEN}4{RESET}) {BOLD}View quality statistics{RESET}
+     📊 Show summary of processed files
+
+  {GREEN}5{RESET}) {BOLD}Export to CSV{RESET}
+     💾 Export metadata to spreadsheet format
+
+  {GREEN}6{RESET}) {BOLD}Test installation{RESET}
+     🔧 Check if all dependencies are installed
+
+  {GREEN}7{RESET}) {BOLD}Help & Documentation{RESET}
+     📖 View usage instructions
+
+  {GREEN}8{RESET}) {BOLD}Pre-download model{RESET}
+     📥 Fetch a Whisper model once so batches start right away
+
+  {RED}0{RESET}) {BOLD}Exit{RESET}
+
+"""
+
+# (data dir mtime_ns, rendered screen) of the last main-screen render
+_main_screen = (None, "")
+
+def render_main_screen():
+    """
+    The main screen (header, data directory status and menu) as one string.
+    Rebuilt only when the data directory changes.
+    """
+    global _main_screen
+    try:
+        mtime_ns = os.stat("data").st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    if _main_screen[1] and _main_screen[0] == mtime_ns:
+        return _main_screen[1]
+    
+    if mtime_ns is None:
+        status = f"{RED}📁 Data directory: Not found (will be created){RESET}"
+    else:
+        mp3_count = len(list_mp3s())
+        if mp3_count > 0:
+            status = f"{GREEN}📁 Data directory: {mp3_count} MP3 files ready{RESET}"
+        else:
+            status = f"{YELLOW}📁 Data directory: Empty (add MP3 files){RESET}"
+    
+    screen = f"{CLEAR_SCREEN}{HEADER}{status}\n\n{MENU}"
+    _main_screen = (mtime_ns, screen)
+    return screen
+
+def list_metadata_files():
+    """Paths of the metadata files in the metadata directory, sorted"""
+    try:
+        with os.scandir("metadata") as entries:
+            # DirEntry.is_file() uses the type from the directory listing,
+            # so this costs no per-file stat
+            return sorted(Path(e.path) for e in entries
+                          if e.name.endswith("_metadata.json") and e.is_file())
+    except FileNotFoundError:
+        return []
+
+def load_json_file(path):
+    """Load one JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_metadata_files(metadata_files):
+    """Load metadata files concurrently, preserving order"""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        return list(pool.map(load_json_file, metadata_files))
+
+CSV_HEADER = (
+    'Filename', 'Duration (s)', 'SNR (dB)', 'Noise Level',
+    'Speech Clarity', 'Voice Activity (%)', 'Speaking Style',
+    'Code Switching', 'Vocabulary Type', 'Transcription Available'
+)
+
+def summarize(data):
+    """Summary row of one metadata file, in CSV_HEADER order (unformatted)"""
+    tags = data['automated_tags']
+    linguistic = data['linguistic_analysis']
+    transcription = data.get('transcription_metadata', data.get('transcription', {}))
+    return (
+        data['file_info']['filename'],
+        data['audio_properties']['duration_seconds'],
+        tags['snr_db'],
+        tags['noise_level'],
+        tags['speech_clarity'],
+        tags['voice_activity_percentage'],
+        tags['speaking_style_suggested'],
+        linguistic['code_switching'],
+        linguistic['vocabulary_type_suggested'],
+        bool(transcription.get('available')),
+    )
+
+def scan_metadata(metadata_files):
+    """
+    Summarize metadata files.
+    Summary rows are kept in the cache database, so only files that are new
+    or changed since the last scan are parsed.
+    Returns one summary row per file (in CSV_HEADER order, unformatted) and
+    NumPy arrays of the columns used for statistics.
+    """
+    import numpy as np
+    
+    conn = open_cache()
+    cached = {name: (size, mtime_ns, row) for name, size, mtime_ns, row
+              in conn.execute("SELECT name, size, mtime_ns, row FROM summaries")}
+    
+    n = len(metadata_files)
+    rows = [None] * n
+    stale = []
+    for i, path in enumerate(metadata_files):
+        st = path.stat()
+        entry = cached.pop(path.name, None)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            rows[i] = tuple(json.loads(entry[2]))
+        else:
+            stale.append((i, path, st))
+    
+    if stale:
+        loaded = load_metadata_files([path for _, path, _ in stale])
+        for (i, path, st), data in zip(stale, loaded):
+            rows[i] = summarize(data)
+    
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+            ((path.name, st.st_size, st.st_mtime_ns, json.dumps(rows[i], ensure_ascii=False))
+             for i, path, st in stale)
+        )
+        # Whatever is left in cached belongs to files that were deleted
+        conn.executemany("DELETE FROM summaries WHERE name = ?",
+                         ((name,) for name in cached))
+    conn.close()
+    
+    arrays = {
+        'snr': np.fromiter((row[2] for row in rows), dtype=np.float32, count=n),
+        'duration': np.fromiter((row[1] for row in rows), dtype=np.float32, count=n),
+        'clarity': np.array([row[4] for row in rows], dtype='U20'),
+    }
+    return rows, arrays
 
 def run_command(cmd):
     """Run a command and handle errors"""
@@ -108,6 +304,401 @@ def run_command(cmd):
         print(f"\n{RED}Error: Command not found. Make sure Python is installed.{RESET}")
         return False
 
+# Must match SERVER_RESULT_MARKER in thai_stt_auto_tagger.py
+SERVER_RESULT_MARKER = "@@THAI_STT_RESULT@@"
+
+# Persistent tagger worker, started once so imports and models stay loaded
+_server = None
+
+def start_server():
+    """Start the persistent tagger worker in the background"""
+    global _server
+    try:
+        _server = subprocess.Popen(
+            [sys.executable, "thai_stt_auto_tagger.py", "--server"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace'
+        )
+    except OSError:
+        _server = None
+        return
+    atexit.register(stop_server)
+
+def stop_server():
+    """Shut down the persistent tagger worker"""
+    if _server is not None and _server.poll() is None:
+        try:
+            _server.stdin.close()
+            _server.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            _server.kill()
+
+def send_job(job):
+    """
+    Run a job on the persistent worker, echoing its progress output.
+    Returns True/False for the job result, or None if the worker is unreachable.
+    """
+    if _server is None or _server.poll() is not None:
+        return None
+    try:
+        _server.stdin.write(json.dumps(job) + "\n")
+        _server.stdin.flush()
+        for line in _server.stdout:
+            if line.startswith(SERVER_RESULT_MARKER):
+                return json.loads(line[len(SERVER_RESULT_MARKER):]).get('ok', False)
+            print(line, end='')
+    except (OSError, ValueError):
+        pass
+    # Worker exited mid-job
+    return None
+
+def run_tagger(job, cmd):
+    """Run a tagger job on the persistent worker, falling back to a subprocess"""
+    result = send_job(job)
+    if result is None:
+        return run_command(cmd)
+    return result
+
+CACHE_PATH = Path("metadata") / "cache.sqlite"
+
+def open_cache():
+    """Open the processed-file cache, creating it if needed"""
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""CREATE TABLE IF NOT EXISTS files (
+        path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)""")
+    conn.execute("""CREATE TABLE IF NOT EXISTS results (
+        digest TEXT, mode TEXT, metadata TEXT, written TEXT,
+        PRIMARY KEY (digest, mode))""")
+    # Caches from before the written column have rows that never match the
+    # metadata on disk, so those files are restored from the cache once
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(results)")]
+    if 'written' not in columns:
+        conn.execute("ALTER TABLE results ADD COLUMN written TEXT")
+    conn.execute("""CREATE TABLE IF NOT EXISTS summaries (
+        name TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, row TEXT)""")
+    return conn
+
+def file_digest(conn, name):
+    """Content hash of a data file, only re-hashed when its size or mtime changed"""
+    path = os.path.join("data", name)
+    st = os.stat(path)
+    row = conn.execute("SELECT size, mtime_ns, digest FROM files WHERE path = ?",
+                       (path,)).fetchone()
+    if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+        return row[2]
+    
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    digest = h.hexdigest()
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                     (path, st.st_size, st.st_mtime_ns, digest))
+    return digest
+
+def metadata_path(name):
+    """Metadata file the tagger writes for an audio file"""
+    return Path("metadata") / f"{os.path.splitext(name)[0]}_metadata.json"
+
+# Hash of the tagger's source, computed once
+_tagger_version = None
+
+def cache_key(mode, extra_args):
+    """
+    Results cache mode for a run: the mode plus a hash of the tagger's source
+    and the options passed to it, so results from another tagger version or
+    other analysis options are never reused
+    """
+    global _tagger_version
+    if _tagger_version is None:
+        _tagger_version = hashlib.blake2b(Path("thai_stt_auto_tagger.py").read_bytes(),
+                                          digest_size=8)
+    h = _tagger_version.copy()
+    h.update("\0".join(extra_args).encode())
+    return f"{mode}:{h.hexdigest()}"
+
+def text_digest(text):
+    """Hash of metadata text, to tell whether the file on disk was replaced"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def human_reviewed(text):
+    """Whether metadata text carries a completed human review"""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    status = data.get('annotation_status') if isinstance(data, dict) else None
+    return bool(status and status.get('human_review_complete'))
+
+def filter_cached(conn, mp3_names, mode):
+    """
+    Split files into those still needing processing and those already done.
+    A file is skipped when its content was processed in the same mode before.
+    If its metadata file is missing, or was since replaced (by a run in
+    another mode or an edit), the cached metadata for this mode is restored,
+    unless the file on disk carries a human review, which is never overwritten.
+    """
+    pending = []
+    for name in mp3_names:
+        digest = file_digest(conn, name)
+        row = conn.execute(
+            "SELECT metadata, written FROM results WHERE digest = ? AND mode = ?",
+            (digest, mode)).fetchone()
+        if row is None:
+            pending.append(name)
+            continue
+        metadata, written = row
+        out_path = metadata_path(name)
+        if out_path.exists():
+            current = out_path.read_text(encoding='utf-8')
+            if text_digest(current) == written or human_reviewed(current):
+                continue
+        out_path.write_text(metadata, encoding='utf-8')
+        if written is None:
+            with conn:
+                conn.execute("UPDATE results SET written = ? WHERE digest = ? AND mode = ?",
+                             (text_digest(metadata), digest, mode))
+    return pending
+
+def store_results(conn, mp3_names, mode, since):
+    """Cache metadata the tagger wrote for these files after `since`"""
+    rows = []
+    for name in mp3_names:
+        out_path = metadata_path(name)
+        if out_path.exists() and out_path.stat().st_mtime >= since:
+            metadata = out_path.read_text(encoding='utf-8')
+            rows.append((file_digest(conn, name), mode, metadata, text_digest(metadata)))
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+
+def run_batch(mp3_names, extra_args, job, workers, mode, devices=(), force=False):
+    """
+    Process files not already in the cache, then cache the new results.
+    Files go to the persistent worker, or with devices and more than one
+    worker, to run_parallel with one process per device.
+    With force, every file is processed again; with force=None the user is
+    asked whether to when some files were processed before.
+    """
+    conn = open_cache()
+    try:
+        mode = cache_key(mode, extra_args)
+        pending = mp3_names if force else filter_cached(conn, mp3_names, mode)
+        skipped = len(mp3_names) - len(pending)
+        if skipped and force is None:
+            answer = input(f"{skipped} unchanged files were already processed. "
+                           f"Reprocess them? (y/N): ").strip().lower()
+            if answer == 'y':
+                pending, skipped = mp3_names, 0
+        if skipped:
+            print(f"{CYAN}Skipping {skipped} unchanged files (already processed){RESET}")
+        if not pending:
+            return True
+        
+        started = time.time()
+        if devices and workers > 1:
+            # One process per GPU slice, each pinned to its own device
+            success = run_parallel(pending, extra_args, workers, devices)
+        else:
+            # The persistent worker spreads the audio analysis over `workers`
+            # processes around its one loaded model
+            job = dict(job, workers=workers)
+            if skipped:
+                job['files'] = pending
+            success = send_job(job)
+            if success is None and workers > 1:
+                success = run_parallel(pending, extra_args, workers)
+            elif success is None:
+                cmd = [sys.executable, "thai_stt_auto_tagger.py", "--input", "data/",
+                       "--workers", "1"]
+                if skipped:
+                    cmd += ["--file", *pending]
+                else:
+                    cmd.append("--all")
+                success = run_command(cmd + extra_args)
+        
+        store_results(conn, pending, mode, started)
+        return success
+    finally:
+        conn.close()
+
+MODELS = {"1": "tiny", "2": "base", "3": "small", "4": "medium", "5": "large"}
+COMPUTE_TYPES = {"1": "int8", "2": "int8_float16", "3": "float16", "4": "float32"}
+
+# Combined full-mode answer: "<model> <compute type> <workers> <batch size>",
+# any leading subset of them, "y" for the defaults or "n" to cancel
+FULL_MODE_ANSWER = re.compile(
+    r"(?P<cancel>n)|y|(?:(?P<model>[1-5])(?:\s+(?P<compute>[1-4])"
+    r"(?:\s+(?P<workers>\d+)(?:\s+(?P<batch>\d+))?)?)?)?",
+    re.IGNORECASE
+)
+
+def print_model_menu():
+    """List the Whisper models"""
+    print(f"{BOLD}Select Whisper model:{RESET}")
+    print(f"  1) tiny   - Fastest, least accurate")
+    print(f"  2) base   - Fast, low accuracy")
+    print(f"  3) small  - Balanced")
+    print(f"  4) medium - Recommended (default)")
+    print(f"  5) large  - Slowest, most accurate")
+
+# Left for the tagger to resolve (resolve_compute_type), so the launcher and
+# the command line pick the same precision
+DEFAULT_COMPUTE_TYPE = "auto"
+
+def print_compute_menu():
+    """List the Whisper compute types"""
+    print(f"\n{BOLD}Select compute type:{RESET} (int8 types need faster-whisper)")
+    print(f"  Enter) auto     - int8_float16 on GPU, int8 on CPU "
+          f"(float16/float32 without faster-whisper)")
+    print(f"  1) int8         - Fastest on CPU, smallest memory")
+    print(f"  2) int8_float16 - Fast on GPU, small memory")
+    print(f"  3) float16      - Half precision on GPU")
+    print(f"  4) float32      - Full precision")
+
+def prompt_model():
+    """Ask which Whisper model to use"""
+    print_model_menu()
+    choice = input("\nChoice [4]: ").strip() or "4"
+    model = MODELS.get(choice, "medium")
+    
+    print(f"\nUsing model: {GREEN}{model}{RESET}")
+    return model
+
+def prompt_compute_type():
+    """Ask which Whisper compute type to use"""
+    default_type = DEFAULT_COMPUTE_TYPE
+    print_compute_menu()
+    choice = input(f"\nChoice [{default_type}]: ").strip()
+    compute_type = COMPUTE_TYPES.get(choice, default_type)
+    print(f"Using compute type: {GREEN}{compute_type}{RESET}\n")
+    return compute_type
+
+def prompt_workers(default):
+    """Ask how many parallel workers to use"""
+    answer = input(f"Parallel workers [{default}]: ").strip()
+    if not answer:
+        return default
+    try:
+        return max(1, int(answer))
+    except ValueError:
+        print(f"{YELLOW}Invalid number, using {default}{RESET}")
+        return default
+
+# Environment variables that size the native thread pools of a worker
+THREAD_LIMIT_VARIABLES = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+_mig_devices = None
+
+def list_mig_devices():
+    """
+    UUIDs of the MIG instances on this machine's GPUs (empty without MIG).
+    Only instances that already exist are listed; creating them is left to
+    the administrator (nvidia-smi mig).
+    """
+    global _mig_devices
+    if _mig_devices is not None:
+        return _mig_devices
+    _mig_devices = []
+    if not PYNVML_AVAILABLE:
+        return _mig_devices
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return _mig_devices
+    try:
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            gpu = pynvml.nvmlDeviceGetHandleByIndex(i)
+            try:
+                current_mode, _ = pynvml.nvmlDeviceGetMigMode(gpu)
+            except pynvml.NVMLError:
+                continue  # GPU without MIG support
+            if current_mode != pynvml.NVML_DEVICE_MIG_ENABLE:
+                continue
+            for j in range(pynvml.nvmlDeviceGetMaxMigDeviceCount(gpu)):
+                try:
+                    mig = pynvml.nvmlDeviceGetMigDeviceHandleByIndex(gpu, j)
+                except pynvml.NVMLError:
+                    continue  # Slot without an instance
+                uuid = pynvml.nvmlDeviceGetUUID(mig)
+                _mig_devices.append(uuid.decode() if isinstance(uuid, bytes) else uuid)
+    except pynvml.NVMLError:
+        pass
+    finally:
+        pynvml.nvmlShutdown()
+    return _mig_devices
+
+def default_full_workers(n_files):
+    """Default worker count with transcription: one per MIG instance if any"""
+    devices = list_mig_devices()
+    if devices:
+        return min(len(devices), n_files)
+    return min(os.cpu_count() or 1, 2, n_files)
+
+def run_parallel(names, extra_args, max_workers, devices=()):
+    """
+    Shard files across worker processes and run the shards concurrently.
+    With devices (CUDA device or MIG UUIDs), each worker is pinned to one of
+    them in turn.
+    """
+    shards = [names[i::max_workers] for i in range(max_workers)]
+    shards = [shard for shard in shards if shard]
+    print_lock = threading.Lock()
+    # PyTorch, CTranslate2 and BLAS each start a thread per core in every
+    # worker; give each worker its share of the cores instead, unless the
+    # user already set the limits
+    threads = str(max(1, (os.cpu_count() or 1) // len(shards)))
+    thread_limits = {name: threads for name in THREAD_LIMIT_VARIABLES
+                     if name not in os.environ}
+    
+    def run_shard(worker_id, shard):
+        # Each shard is one of the workers, so it analyzes in a single process
+        cmd = [sys.executable, "thai_stt_auto_tagger.py", "--input", "data/",
+               "--file", *shard, "--workers", "1", *extra_args]
+        env = dict(os.environ, **thread_limits)
+        if devices:
+            env['CUDA_VISIBLE_DEVICES'] = devices[(worker_id - 1) % len(devices)]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, encoding='utf-8', errors='replace', env=env)
+        # Only echo per-file milestones and errors so concurrent workers stay
+        # readable; the rest is kept to explain a worker that crashes
+        tail = deque(maxlen=20)
+        for line in proc.stdout:
+            if ("Processing:" in line or "Saved to:" in line or "❌" in line
+                    or "Error:" in line):
+                with print_lock:
+                    print(f"  {CYAN}[worker {worker_id}]{RESET} {line.strip()}")
+            elif line.strip():
+                tail.append(line.rstrip())
+        returncode = proc.wait()
+        if returncode != 0 and tail:
+            with print_lock:
+                print(f"  {RED}[worker {worker_id}] last output:{RESET}")
+                for line in tail:
+                    print(f"    {line}")
+        return returncode
+    
+    if devices:
+        print(f"Running {len(shards)} workers in parallel on {len(devices)} GPU slices\n")
+    else:
+        print(f"Running {len(shards)} workers in parallel\n")
+    success = True
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        futures = {pool.submit(run_shard, i, shard): i for i, shard in enumerate(shards, 1)}
+        for future in as_completed(futures):
+            try:
+                returncode = future.result()
+            except OSError as e:
+                print(f"\n{RED}Error: Could not start worker: {e}{RESET}")
+                success = False
+                continue
+            if returncode != 0:
+                print(f"{RED}Worker {futures[future]} failed with exit code {returncode}{RESET}")
+                success = False
+    return success
+
 def process_all_fast():
     """Process all files without transcription"""
     print_header()
@@ -120,7 +711,7 @@ def process_all_fast():
         input("\nPress Enter to continue...")
         return
     
-    mp3_files = list(Path("data").glob("*.mp3"))
+    mp3_files = list_mp3s()
     if not mp3_files:
         print(f"{RED}No MP3 files found in 'data' directory.{RESET}")
         print(f"Please add some audio files and try again.")
@@ -130,17 +721,15 @@ def process_all_fast():
     print(f"Found {GREEN}{len(mp3_files)}{RESET} MP3 files")
     print(f"Estimated time: ~{len(mp3_files)} seconds\n")
     
-    proceed = input("Proceed? (Y/n): ").strip().lower()
-    if proceed and proceed != 'y':
+    default_workers = min(os.cpu_count() or 1, len(mp3_files))
+    answer = input(f"Workers [{default_workers}] / Proceed [Y] "
+                   f"(number of workers, Enter, or n): ").strip().lower()
+    if answer == 'n':
         return
+    workers = int(answer) if answer.isdigit() and int(answer) > 0 else default_workers
     
     print()
-    cmd = [sys.executable, "thai_stt_auto_tagger.py", "--input", "data/", "--all", "--no-transcription"]
-    success = run_command(cmd)
-    
-    if success:
-        print(f"\n{GREEN}✓ Processing complete!{RESET}")
-        print(f"Check the 'metadata' directory for results.")
+    run_fast(mp3_files, workers, force=None)
     
     input("\nPress Enter to continue...")
 
@@ -156,7 +745,7 @@ def process_all_full():
         input("\nPress Enter to continue...")
         return
     
-    mp3_files = list(Path("data").glob("*.mp3"))
+    mp3_files = list_mp3s()
     if not mp3_files:
         print(f"{RED}No MP3 files found in 'data' directory.{RESET}")
         print(f"Please add some audio files and try again.")
@@ -166,35 +755,65 @@ def process_all_full():
     print(f"Found {GREEN}{len(mp3_files)}{RESET} MP3 files")
     print(f"Estimated time: ~{len(mp3_files) * 60 // 60} minutes (with transcription)\n")
     
-    print(f"{BOLD}Select Whisper model:{RESET}")
-    print(f"  1) tiny   - Fastest, least accurate")
-    print(f"  2) base   - Fast, low accuracy")
-    print(f"  3) small  - Balanced")
-    print(f"  4) medium - Recommended (default)")
-    print(f"  5) large  - Slowest, most accurate")
-    
-    choice = input("\nChoice [4]: ").strip() or "4"
+    print_model_menu()
+    default_type = DEFAULT_COMPUTE_TYPE
+    print_compute_menu()
+    default_workers = default_full_workers(len(mp3_files))
     
-    models = {"1": "tiny", "2": "base", "3": "small", "4": "medium", "5": "large"}
-    model = models.get(choice, "medium")
+    print(f"\n{YELLOW}Note: First run will download the model (~244MB-1.5GB) unless")
+    print(f"      it was fetched with option 8{RESET}")
+    # Workers analyze audio for the one loaded Whisper model (on a MIG GPU,
+    # each has its own slice and model), so they default low; short clips
+    # are transcribed together in batches
+    print(f"\n{BOLD}Model [4] / Compute [{default_type}] / Workers [{default_workers}] / "
+          f"Batch [8] / Proceed [Y]{RESET}")
+    print(f"Enter values separated by spaces (e.g. '3 1 2 8'), Enter for the defaults, "
+          f"or n to cancel")
+    match = FULL_MODE_ANSWER.fullmatch(input("> ").strip())
+    if not match:
+        print(f"{RED}Invalid answer.{RESET}")
+        input("\nPress Enter to continue...")
+        return
+    if match['cancel']:
+        return
     
-    print(f"\nUsing model: {GREEN}{model}{RESET}")
-    print(f"{YELLOW}Note: First run will download the model (~244MB-1.5GB){RESET}\n")
+    model = MODELS[match['model'] or "4"]
+    compute_type = COMPUTE_TYPES[match['compute']] if match['compute'] else default_type
+    workers = max(1, int(match['workers'])) if match['workers'] else default_workers
+    batch_size = max(1, int(match['batch'])) if match['batch'] else 8
+    print(f"\nUsing model {GREEN}{model}{RESET} ({compute_type}), "
+          f"{workers} worker(s), batch size {batch_size}\n")
     
-    proceed = input("Proceed? (Y/n): ").strip().lower()
-    if proceed and proceed != 'y':
-        return
+    run_full(mp3_files, model, compute_type, workers, batch_size, force=None)
     
-    print()
-    cmd = [sys.executable, "thai_stt_auto_tagger.py", "--input", "data/", "--all", 
-           "--whisper-model", model]
-    success = run_command(cmd)
+    input("\nPress Enter to continue...")
+
+def run_fast(mp3_files, workers, force=False):
+    """Process files without transcription, returning True on success"""
+    job = {"input": "data/", "no_transcription": True}
+    success = run_batch(mp3_files, ["--no-transcription"], job, workers, "fast",
+                        force=force)
     
     if success:
         print(f"\n{GREEN}✓ Processing complete!{RESET}")
         print(f"Check the 'metadata' directory for results.")
+    return success
+
+def run_full(mp3_files, model, compute_type, workers, batch_size, force=False):
+    """Process files with transcription, returning True on success"""
+    job = {"input": "data/", "whisper_model": model, "compute_type": compute_type,
+           "batch_size": batch_size}
+    extra_args = ["--whisper-model", model, "--compute-type", compute_type,
+                  "--batch-size", str(batch_size)]
+    # On a MIG-partitioned GPU each worker gets its own slice, so several
+    # small models transcribe side by side instead of sharing one context
+    success = run_batch(mp3_files, extra_args, job, workers, f"full:{model}:{compute_type}",
+                        list_mig_devices(), force)
     
-    input("\nPress Enter to continue...")
+    if success:
+        print(f"\n{GREEN}✓ Processing complete!{RESET}")
+        print(f"Check the 'metadata' directory for results.")
+    return success
 
 def process_single():
     """Process a single file"""
@@ -208,15 +827,15 @@ def process_single():
         input("\nPress Enter to continue...")
         return
     
-    mp3_files = list(Path("data").glob("*.mp3"))
+    mp3_files = list_mp3s()
     if not mp3_files:
         print(f"{RED}No MP3 files found in 'data' directory.{RESET}")
         input("\nPress Enter to continue...")
         return
     
     print(f"{BOLD}Available files:{RESET}\n")
-    for i, f in enumerate(mp3_files, 1):
-        print(f"  {i}) {f.name}")
+    for i, name in enumerate(mp3_files, 1):
+        print(f"  {i}) {name}")
     
     print()
     choice = input("Select file number: ").strip()
@@ -234,13 +853,14 @@ def process_single():
     transcribe = input("\nEnable transcription? (y/N): ").strip().lower()
     
     print()
+    job = {"input": "data/", "files": [selected_file], "no_transcription": transcribe != 'y'}
     cmd = [sys.executable, "thai_stt_auto_tagger.py", "--input", "data/", 
-           "--file", selected_file.name]
+           "--file", selected_file]
     
     if transcribe != 'y':
         cmd.append("--no-transcription")
     
-    success = run_command(cmd)
+    success = run_tagger(job, cmd)
     
     if success:
         print(f"\n{GREEN}✓ Processing complete!{RESET}")
@@ -252,52 +872,43 @@ def view_statistics():
     print_header()
     print(f"{BOLD}Quality Statistics{RESET}\n")
     
-    if not Path("metadata").exists() or not list(Path("metadata").glob("*_metadata.json")):
+    metadata_files = list_metadata_files()
+    if not metadata_files:
         print(f"{RED}No metadata files found.{RESET}")
         print(f"Please process some audio files first.")
         input("\nPress Enter to continue...")
         return
     
-    # Quick stats using Python
-    import json
     from collections import Counter
     
-    metadata_files = list(Path("metadata").glob("*_metadata.json"))
+    n = len(metadata_files)
     
-    noise_levels = []
-    clarity_levels = []
-    snr_values = []
-    durations = []
+    rows, arrays = scan_metadata(metadata_files)
+    snr_values = arrays['snr']
+    durations = arrays['duration']
+    clarity_levels = arrays['clarity']
+    noise_levels = [row[3] for row in rows]
     
-    for mf in metadata_files:
-        with open(mf, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        noise_levels.append(data['automated_tags']['noise_level'])
-        clarity_levels.append(data['automated_tags']['speech_clarity'])
-        snr_values.append(data['automated_tags']['snr_db'])
-        durations.append(data['audio_properties']['duration_seconds'])
-    
-    print(f"{BOLD}Total files processed:{RESET} {GREEN}{len(metadata_files)}{RESET}")
-    print(f"{BOLD}Total duration:{RESET} {sum(durations)/60:.1f} minutes\n")
+    print(f"{BOLD}Total files processed:{RESET} {GREEN}{n}{RESET}")
+    print(f"{BOLD}Total duration:{RESET} {durations.sum()/60:.1f} minutes\n")
     
     print(f"{BOLD}Noise Levels:{RESET}")
     for level, count in Counter(noise_levels).most_common():
-        pct = count/len(metadata_files)*100
+        pct = count/n*100
         print(f"  {level:20} {count:3} ({pct:5.1f}%)")
     
     print(f"\n{BOLD}Speech Clarity:{RESET}")
-    for level, count in Counter(clarity_levels).most_common():
-        pct = count/len(metadata_files)*100
+    for level, count in Counter(clarity_levels.tolist()).most_common():
+        pct = count/n*100
         print(f"  {level:20} {count:3} ({pct:5.1f}%)")
     
     print(f"\n{BOLD}SNR Statistics:{RESET}")
-    print(f"  Average: {sum(snr_values)/len(snr_values):.2f} dB")
-    print(f"  Min:     {min(snr_values):.2f} dB")
-    print(f"  Max:     {max(snr_values):.2f} dB")
+    print(f"  Average: {snr_values.mean():.2f} dB")
+    print(f"  Min:     {snr_values.min():.2f} dB")
+    print(f"  Max:     {snr_values.max():.2f} dB")
     
-    high_quality = sum(1 for i in range(len(metadata_files))
-                      if snr_values[i] > 25 and clarity_levels[i] == 'clear_speech')
-    print(f"\n{BOLD}High Quality Files:{RESET} {high_quality} ({high_quality/len(metadata_files)*100:.1f}%)")
+    high_quality = int(((snr_values > 25) & (clarity_levels == 'clear_speech')).sum())
+    print(f"\n{BOLD}High Quality Files:{RESET} {high_quality} ({high_quality/n*100:.1f}%)")
     print(f"  (SNR > 25 dB and clear speech)")
     
     input("\n\nPress Enter to continue...")
@@ -307,43 +918,28 @@ def export_csv():
     print_header()
     print(f"{BOLD}Export to CSV{RESET}\n")
     
-    if not Path("metadata").exists() or not list(Path("metadata").glob("*_metadata.json")):
+    metadata_files = list_metadata_files()
+    if not metadata_files:
         print(f"{RED}No metadata files found.{RESET}")
         print(f"Please process some audio files first.")
         input("\nPress Enter to continue...")
         return
     
-    import json
     import csv
     
-    metadata_files = list(Path("metadata").glob("*_metadata.json"))
     csv_path = Path("metadata") / "summary.csv"
     
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        writer.writerow([
-            'Filename', 'Duration (s)', 'SNR (dB)', 'Noise Level',
-            'Speech Clarity', 'Voice Activity (%)', 'Speaking Style',
-            'Code Switching', 'Vocabulary Type', 'Transcription Available'
-        ])
-        
-        for mf in metadata_files:
-            with open(mf, 'r', encoding='utf-8') as jf:
-                data = json.load(jf)
-            
-            writer.writerow([
-                data['file_info']['filename'],
-                f"{data['audio_properties']['duration_seconds']:.2f}",
-                f"{data['automated_tags']['snr_db']:.2f}",
-                data['automated_tags']['noise_level'],
-                data['automated_tags']['speech_clarity'],
-                f"{data['automated_tags']['voice_activity_percentage']:.1f}",
-                data['automated_tags']['speaking_style_suggested'],
-                data['linguistic_analysis']['code_switching'],
-                data['linguistic_analysis']['vocabulary_type_suggested'],
-                'Yes' if data['transcription']['available'] else 'No'
-            ])
+    rows, _ = scan_metadata(metadata_files)
+    
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(
+            (name, f"{duration:.2f}", f"{snr:.2f}", noise, clarity, f"{activity:.1f}",
+             style, code_switching, vocab, 'Yes' if transcribed else 'No')
+            for (name, duration, snr, noise, clarity, activity,
+                 style, code_switching, vocab, transcribed) in rows
+        )
     
     print(f"{GREEN}✓ CSV exported successfully!{RESET}")
     print(f"Location: {csv_path}")
@@ -351,58 +947,159 @@ def export_csv():
     
     input("\n\nPress Enter to continue...")
 
+def download_model():
+    """Download a Whisper model into the local model cache"""
+    print_header()
+    print(f"{BOLD}Pre-download Whisper Model{RESET}\n")
+    print(f"Models are stored in: {MODEL_CACHE_DIR.resolve()}\n")
+    
+    model = prompt_model()
+    compute_type = prompt_compute_type()
+    
+    cmd = [sys.executable, "thai_stt_auto_tagger.py", "--download-model",
+           "--whisper-model", model, "--compute-type", compute_type]
+    if run_command(cmd):
+        print(f"\n{GREEN}✓ Model {model} is ready!{RESET}")
+    
+    input("\nPress Enter to continue...")
+
+# (module, required) pairs checked by test_installation
+INSTALL_CHECKS = (
+    ("numpy", True),
+    ("librosa", True),
+    ("soundfile", True),
+    ("pydub", True),
+    ("whisper", False),
+    ("faster_whisper", False),
+    ("pythainlp", False),
+    ("orjson", False),
+    ("pynvml", False),
+)
+
 def test_installation():
     """Test if all dependencies are installed"""
     print_header()
     print(f"{BOLD}Testing Installation{RESET}\n")
     
-    cmd = [sys.executable, "test_installation.py"]
-    run_command(cmd)
+    if Path("test_installation.py").exists():
+        cmd = [sys.executable, "test_installation.py"]
+        run_command(cmd)
+    else:
+        # Import each package for real, which also catches broken installs
+        # that check_requirements' lookup can't see
+        for name, required in INSTALL_CHECKS:
+            try:
+                importlib.import_module(name)
+                print(f"  {GREEN}✓{RESET} {name}")
+            except Exception as e:
+                color = RED if required else YELLOW
+                label = "required" if required else "optional"
+                print(f"  {color}✗ {name} ({label}): {e}{RESET}")
     
     input("\n\nPress Enter to continue...")
 
+HELP = f"""{BOLD}Help & Documentation{RESET}
+
+{CYAN}Quick Start:{RESET}
+  1. Place your MP3 files in the 'data' directory
+  2. Choose option 1 for quick analysis (no transcription)
+  3. Or choose option 2 for full analysis (with transcription)
+  4. Results are saved in the 'metadata' directory
+
+{CYAN}Processing Modes:{RESET}
+  Fast Mode:  Audio analysis only (~1 second per file)
+              - Noise level, clarity, voice activity
+  Full Mode:  Includes transcription (~30-120s per file)
+              - Everything in fast mode PLUS
+              - Thai transcription, code-switching, vocabulary
+
+{CYAN}Output:{RESET}
+  Each file gets a JSON metadata file with:
+  - Automated tags (noise, clarity, etc.)
+  - Transcription (if enabled)
+  - Linguistic analysis
+  - Flags for manual review
+
+{CYAN}Documentation Files:{RESET}
+"""
+
+DOC_FILES = (
+    ("QUICKSTART.md", "  ✓ QUICKSTART.md   - 5-minute quick start guide\n"),
+    ("README.md", "  ✓ README.md       - Complete documentation\n"),
+    ("PROJECT_SUMMARY.md", "  ✓ PROJECT_SUMMARY.md - Project overview\n"),
+)
+
 def show_help():
     """Show help and documentation"""
-    print_header()
-    print(f"{BOLD}Help & Documentation{RESET}\n")
-    
-    print(f"{CYAN}Quick Start:{RESET}")
-    print(f"  1. Place your MP3 files in the 'data' directory")
-    print(f"  2. Choose option 1 for quick analysis (no transcription)")
-    print(f"  3. Or choose option 2 for full analysis (with transcription)")
-    print(f"  4. Results are saved in the 'metadata' directory\n")
-    
-    print(f"{CYAN}Processing Modes:{RESET}")
-    print(f"  Fast Mode:  Audio analysis only (~1 second per file)")
-    print(f"              - Noise level, clarity, voice activity")
-    print(f"  Full Mode:  Includes transcription (~30-120s per file)")
-    print(f"              - Everything in fast mode PLUS")
-    print(f"              - Thai transcription, code-switching, vocabulary\n")
-    
-    print(f"{CYAN}Output:{RESET}")
-    print(f"  Each file gets a JSON metadata file with:")
-    print(f"  - Automated tags (noise, clarity, etc.)")
-    print(f"  - Transcription (if enabled)")
-    print(f"  - Linguistic analysis")
-    print(f"  - Flags for manual review\n")
-    
-    print(f"{CYAN}Documentation Files:{RESET}")
-    if Path("QUICKSTART.md").exists():
-        print(f"  ✓ QUICKSTART.md   - 5-minute quick start guide")
-    if Path("README.md").exists():
-        print(f"  ✓ README.md       - Complete documentation")
-    if Path("PROJECT_SUMMARY.md").exists():
-        print(f"  ✓ PROJECT_SUMMARY.md - Project overview")
-    
-    print(f"\n{CYAN}System Info:{RESET}")
-    print(f"  Python:   {sys.version.split()[0]}")
-    print(f"  Platform: {platform.system()} {platform.release()}")
-    print(f"  Current:  {Path.cwd()}")
+    parts = [CLEAR_SCREEN, HEADER, HELP]
+    parts.extend(line for name, line in DOC_FILES if Path(name).exists())
+    parts.append(
+        f"\n{CYAN}System Info:{RESET}\n"
+        f"  Python:   {sys.version.split()[0]}\n"
+        f"  Platform: {platform.system()} {platform.release()}\n"
+        f"  Current:  {Path.cwd()}\n"
+    )
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
     
     input("\n\nPress Enter to continue...")
 
+def parse_args():
+    """Command-line options for running a batch without the menu"""
+    parser = argparse.ArgumentParser(
+        description="Thai STT Auto-Tagger launcher. Without options, shows the interactive menu."
+    )
+    parser.add_argument('--all', action='store_true',
+                        help='Process all MP3 files in data/ without the menu, then exit')
+    parser.add_argument('--no-transcription', action='store_true',
+                        help='With --all: audio analysis only (FAST mode)')
+    parser.add_argument('--model', default='medium', choices=list(MODELS.values()),
+                        help='With --all: Whisper model (default: medium)')
+    parser.add_argument('--compute-type', default=DEFAULT_COMPUTE_TYPE,
+                        choices=[DEFAULT_COMPUTE_TYPE, *COMPUTE_TYPES.values()],
+                        help='With --all: Whisper compute type (default: auto = '
+                             'int8_float16 on GPU, int8 on CPU with faster-whisper)')
+    parser.add_argument('--workers', type=int,
+                        help='With --all: parallel workers (default: CPU count, '
+                             'at most 2 with transcription)')
+    parser.add_argument('--batch-size', type=int, default=8,
+                        help='With --all: transcription batch size (default: 8)')
+    parser.add_argument('--force', action='store_true',
+                        help='With --all: reprocess files that were already processed '
+                             'instead of reusing the cached results')
+    return parser.parse_args()
+
+def run_preset(args):
+    """Run the batch described by the command-line options, returning an exit code"""
+    errors, _ = check_requirements()
+    if errors:
+        for error in errors:
+            print(f"{RED}✗ {error}{RESET}")
+        return 1
+    
+    mp3_files = list_mp3s()
+    if not mp3_files:
+        print(f"{RED}No MP3 files found in 'data' directory.{RESET}")
+        return 1
+    print(f"Found {GREEN}{len(mp3_files)}{RESET} MP3 files\n")
+    
+    if args.no_transcription:
+        workers = args.workers or min(os.cpu_count() or 1, len(mp3_files))
+        success = run_fast(mp3_files, max(1, workers), args.force)
+    else:
+        workers = args.workers or default_full_workers(len(mp3_files))
+        success = run_full(mp3_files, args.model, args.compute_type,
+                           max(1, workers), max(1, args.batch_size), args.force)
+    return 0 if success else 1
+
 def main():
     """Main application loop"""
+    args = parse_args()
+    use_model_cache()
+    
+    if args.all:
+        sys.exit(run_preset(args))
+    
     # Check requirements
     errors, warnings = check_requirements()
     
@@ -424,21 +1121,12 @@ def main():
         print()
         input("Press Enter to continue...")
     
+    start_server()
+    
     # Main menu loop
     while True:
-        print_header()
-        
-        # Show data directory status
-        if Path("data").exists():
-            mp3_count = len(list(Path("data").glob("*.mp3")))
-            if mp3_count > 0:
-                print(f"{GREEN}📁 Data directory: {mp3_count} MP3 files ready{RESET}\n")
-            else:
-                print(f"{YELLOW}📁 Data directory: Empty (add MP3 files){RESET}\n")
-        else:
-            print(f"{RED}📁 Data directory: Not found (will be created){RESET}\n")
-        
-        print_menu()
+        sys.stdout.write(render_main_screen())
+        sys.stdout.flush()
         
         choice = input(f"{BOLD}Select option:{RESET} ").strip()
         
@@ -456,6 +1144,8 @@ def main():
             test_installation()
         elif choice == '7':
             show_help()
+        elif choice == '8':
+            download_model()
         elif choice == '0':
             print(f"\n{CYAN}Thanks for using Thai STT Auto-Tagger! Goodbye! 👋{RESET}\n")
             break
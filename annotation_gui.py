@@ -12,23 +12,43 @@ Improvements:
 - Review status tracking with date/time
 """
 
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
+import getpass
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Mixer buffer in samples. The platform default is sometimes small enough to
+# underrun while Tk is busy; override with KUTHAISTT_AUDIO_BUFFER if needed.
+AUDIO_BUFFER = os.environ.get("KUTHAISTT_AUDIO_BUFFER", "4096")
+AUDIO_BUFFER = int(AUDIO_BUFFER) if AUDIO_BUFFER.isdigit() else 4096
+
 # Try to import audio playback
 try:
     import pygame
-    pygame.mixer.init()
+    pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=AUDIO_BUFFER)
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
     print("Warning: pygame not installed - audio playback disabled")
     print("Install with: pip install pygame")
+except pygame.error as e:
+    AUDIO_AVAILABLE = False
+    print(f"Warning: could not open audio device - audio playback disabled ({e})")
 
 
 # Helper text for annotation fields
@@ -107,24 +127,234 @@ HOW TO DECIDE:
 """
 }
 
+# Small categorical fields repeated across every metadata file, by section.
+# Interning them lets all cached files share one string object per value.
+CATEGORICAL_FIELDS = {
+    'automated_tags': ('noise_level', 'speech_clarity', 'speaker_gender',
+                       'speaking_style_suggested', 'dialect'),
+    'manual_annotations': ('speaker_gender', 'code_switching', 'speaking_style',
+                           'dialect', 'vocabulary_type'),
+    'linguistic_analysis': ('code_switching', 'vocabulary_type_suggested'),
+    'annotation_status': ('human_annotator',),
+}
+
+
+def intern_categories(data: dict):
+    """Intern the categorical string fields of a metadata dict in place"""
+    for section, keys in CATEGORICAL_FIELDS.items():
+        values = data.get(section)
+        if not isinstance(values, dict):
+            continue
+        for key in keys:
+            value = values.get(key)
+            if isinstance(value, str):
+                values[key] = sys.intern(value)
+
+
+EMPTY = {}
+
+
+def review_status(data: dict) -> Tuple[bool, str, str]:
+    """(reviewed, review_date, reviewer) from a metadata dict"""
+    status = data.get('annotation_status') or EMPTY
+    return (status.get('human_review_complete', False),
+            status.get('review_date', ''),
+            status.get('human_annotator', ''))
+
+
+def format_review_date(review_date: str) -> str:
+    """Review date as shown in the GUI, or '' if missing or unparseable"""
+    if not review_date:
+        return ''
+    try:
+        return datetime.fromisoformat(review_date).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return ''
+
+
+def read_metadata(path: Path) -> dict:
+    """Parse a metadata file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    intern_categories(data)
+    return data
+
+
+def dump_metadata(data: dict) -> bytes:
+    """Encode metadata as indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def read_metadata_or_none(path: Path) -> Optional[dict]:
+    """Parse a metadata file, returning None if it can't be read"""
+    try:
+        return read_metadata(path)
+    except Exception:
+        return None
+
+
+def warm_file(path: str, chunk_size: int = 1 << 20):
+    """Read a file and discard it, so the OS has it cached when it is opened for real"""
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            while f.read(chunk_size):
+                pass
+    except OSError:
+        pass
+
+# Choices of each selection field, and each choice's position in its list
+OPTIONS = {
+    'noise_level': ['low_noise', 'medium_noise', 'high_noise'],
+    'speech_clarity': ['clear_speech', 'muffled_speech', 'distorted_speech'],
+    'speaker_gender': ['male', 'female', 'child', 'unknown'],
+    'code_switching': ['no_code_switching', 'code_switching'],
+    'speaking_style': ['read_speech', 'spontaneous_speech', 'conversational'],
+    'dialect': ['central_thai', 'northern_thai', 'isan_thai', 'southern_thai', 'other_thai_dialect'],
+    'vocabulary_type': ['general_vocab', 'business_vocab', 'medical_vocab', 'technical_vocab', 'mixed_vocab'],
+}
+OPTION_INDEX = {field: {value: i for i, value in enumerate(values)}
+                for field, values in OPTIONS.items()}
+
+# Automated tags that full mode saves back into automated_tags
+FULL_MODE_OVERRIDES = frozenset({'noise_level', 'speech_clarity'})
+
+HELPER_PLACEHOLDER = "Select a field to see helpful guidelines..."
+
+INSTRUCTIONS_TEXT = """
+Thai STT Annotation Tool - Instructions
+
+GETTING STARTED:
+1. Audio files should be in 'data' directory
+2. Metadata files should be in 'metadata' directory
+3. Select a file from the left panel to begin
+
+EDIT MODES:
+• Partial Mode (Default): Shows only fields requiring manual review
+  - Speaker gender, dialect, speaking style, vocabulary type
+  - Quick annotation for essential fields only
+
+• Full Mode: Shows all fields including automated tags
+  - Use for detailed review or corrections
+  - Can override any automated classification
+
+REQUIRED FIELDS (marked with *):
+• Code-Switching: Confirm or change AI suggestion (? for help)
+• Speaking Style: Confirm or change AI suggestion (? for help)
+• Dialect: central_thai/northern_thai/isan_thai/southern_thai
+• Vocabulary Type: Confirm or change AI suggestion (? for help)
+
+HELPER BUTTONS (?):
+• Click the "?" button next to Code-Switching, Speaking Style or Vocabulary Type
+• Detailed guidelines appear in the right panel
+• Helps you make accurate classifications
+
+AUDIO PLAYBACK:
+• Click ▶ Play to listen to the audio
+• Click ■ Stop to stop playback
+• Make sure audio file exists in 'data' directory
+
+REVIEW STATUS:
+• Files marked ✓ are reviewed (shows date/time)
+• Files marked ○ are pending review
+• Your annotations are timestamped automatically
+
+SAVING:
+• Ctrl+S: Save current file
+• Ctrl+N: Save and move to next file
+• F11: Toggle fullscreen
+• 💾 Save button: Save without moving
+• 💾 Save & Next button: Save and go to next
+
+STATUS INDICATORS:
+• ✓ = Reviewed (green) with timestamp
+• ○ = Pending review (gray)
+• * = Unsaved changes
+
+NOTES:
+• Add any observations or issues in the Notes section
+• Notes are saved with the annotations
+• Use for documenting unusual cases or problems
+"""
+
 
 class AnnotationGUI:
     """Main GUI application for annotation"""
     
+    # Fixed attribute layout; every attribute set on the instance must be listed
+    __slots__ = (
+        'root', '_metadata_dir', 'current_file', 'current_data', 'modified', 'edit_mode', '_annotator',
+        '_filter_job', '_meta_cache', '_mtimes', '_reviewed', '_load_generation',
+        '_shown_list', '_fields_mode', '_refresh_pending', '_redisplay_file',
+        'current_audio_path', '_loaded_audio_path', '_audio_exec', '_instructions_win',
+        'resizable_widgets', 'metadata_files', '_names_lower',
+        # Widgets and Tk variables
+        'main_container', 'file_tree', 'search_var', 'stats_label', 'mode_var',
+        'content_frame', 'helper_text', '_helper_current', 'status_var',
+        'play_button', 'stop_button',
+        # Annotation field widgets, rebuilt per edit mode
+        'field_widgets', '_field_cache', '_combos', '_info_labels', '_title_label',
+        '_trans_text', '_status_label', '_date_label', '_reviewer_label',
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Thai STT Annotation Tool")
         self.root.geometry("1400x900")
         
+        # Metadata directory; audio is looked up in 'data' next to it
+        self._metadata_dir = Path("metadata")
+        
         # Data
         self.metadata_files: List[Path] = []
+        self._names_lower: List[str] = []  # Lowercased names, for filtering
         self.current_file: Optional[Path] = None
         self.current_data: Optional[Dict] = None
         self.modified = False
         self.edit_mode = "partial"  # "partial" or "full"
         
+        # Annotator recorded with each save. getpass reads $LOGNAME/$USER and
+        # the password database, so unlike os.getlogin() it works without a tty
+        try:
+            self._annotator = getpass.getuser()
+        except Exception:
+            self._annotator = "unknown"
+        
+        # Pending after() job for the filter entry
+        self._filter_job = None
+        
+        # Parsed metadata by path, as (mtime_ns, data, formatted review date)
+        self._meta_cache: Dict[Path, Tuple[float, dict, str]] = {}
+        self._mtimes: Dict[Path, int] = {}
+        # Listed files known to be reviewed, updated as files are cached
+        self._reviewed: set = set()
+        # Bumped on every reload; invalidates background loads started before
+        # it, and together with the filter text tells update_file_list
+        # whether the shown rows are current
+        self._load_generation = 0
+        self._shown_list = None
+        
+        # Edit mode the annotation widgets were last built for
+        self._fields_mode = None
+        
+        # Coalesced list/stats refresh queued with after_idle, and the saved
+        # file whose fields it should redisplay
+        self._refresh_pending = False
+        self._redisplay_file: Optional[Path] = None
+        
         # Audio
         self.current_audio_path: Optional[str] = None
+        # File currently loaded into pygame.mixer.music
+        self._loaded_audio_path: Optional[str] = None
+        # Reads the selected file's audio ahead of a Play click
+        self._audio_exec = ThreadPoolExecutor(max_workers=1) if AUDIO_AVAILABLE else None
+        
+        # Instructions dialog, built on first use
+        self._instructions_win: Optional[tk.Toplevel] = None
         
         # Track widgets for resizing
         self.resizable_widgets = []
@@ -215,7 +445,7 @@ class AnnotationGUI:
         
         ttk.Label(search_frame, text="Filter:").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self.filter_file_list())
+        self.search_var.trace('w', lambda *args: self._schedule_filter())
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
@@ -226,12 +456,21 @@ class AnnotationGUI:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.file_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, 
-                                        selectmode=tk.SINGLE, font=('Courier', 9))
-        self.file_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.file_listbox.yview)
-        
-        self.file_listbox.bind('<<ListboxSelect>>', self.on_file_select)
+        # One row per metadata file, with the file's path as the item id.
+        # Filtering detaches rows rather than deleting them.
+        self.file_tree = ttk.Treeview(list_frame, columns=('status', 'date'),
+                                      show='tree headings', selectmode='browse',
+                                      yscrollcommand=scrollbar.set)
+        self.file_tree.heading('#0', text='File', anchor=tk.W)
+        self.file_tree.heading('status', text='')
+        self.file_tree.heading('date', text='Reviewed', anchor=tk.W)
+        self.file_tree.column('#0', width=220, stretch=True)
+        self.file_tree.column('status', width=30, anchor=tk.CENTER, stretch=False)
+        self.file_tree.column('date', width=120, stretch=False)
+        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.file_tree.yview)
+        
+        self.file_tree.bind('<<TreeviewSelect>>', self.on_file_select)
         
         # Legend
         legend_frame = ttk.LabelFrame(left_frame, text="Status", padding=5)
@@ -304,10 +543,28 @@ class AnnotationGUI:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Mouse wheel scrolling
+        # Mouse wheel scrolling, active only while the pointer is over the
+        # canvas so wheel events elsewhere (e.g. the file list) skip this handler
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        
+        def bind_wheel(event):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+            # X11 reports the wheel as buttons 4 and 5
+            canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+            canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        
+        def unbind_wheel(event):
+            # Moving onto a field inside the canvas also fires <Leave>
+            inside = canvas.winfo_containing(*canvas.winfo_pointerxy())
+            if inside is not None and str(inside).startswith(str(canvas)):
+                return
+            canvas.unbind_all("<MouseWheel>")
+            canvas.unbind_all("<Button-4>")
+            canvas.unbind_all("<Button-5>")
+        
+        canvas.bind('<Enter>', bind_wheel)
+        canvas.bind('<Leave>', unbind_wheel)
         
         # Right side: Helper panel
         helper_frame = ttk.LabelFrame(content_paned, text="Helper Guide", padding=10)
@@ -317,6 +574,7 @@ class AnnotationGUI:
                                    bg='#f0f0f0', relief=tk.FLAT, padx=10, pady=10)
         self.helper_text.pack(fill=tk.BOTH, expand=True)
         self.helper_text.config(state=tk.DISABLED)
+        self._helper_current = ''  # Nothing shown yet
         
         # Initial message
         ttk.Label(self.content_frame, text="Select a file from the list to begin annotation",
@@ -324,90 +582,211 @@ class AnnotationGUI:
     
     def show_helper_text(self, field_type):
         """Show helper text for a specific field"""
-        if field_type in HELPER_TEXT:
-            self.helper_text.config(state=tk.NORMAL)
-            self.helper_text.delete('1.0', tk.END)
-            self.helper_text.insert('1.0', HELPER_TEXT[field_type])
-            self.helper_text.config(state=tk.DISABLED)
-        else:
-            self.helper_text.config(state=tk.NORMAL)
-            self.helper_text.delete('1.0', tk.END)
-            self.helper_text.insert('1.0', "Select a field to see helpful guidelines...")
-            self.helper_text.config(state=tk.DISABLED)
+        # Focus moves between fields often; only redraw when the topic changes
+        if field_type == self._helper_current:
+            return
+        self._helper_current = field_type
+        
+        self.helper_text.config(state=tk.NORMAL)
+        self.helper_text.delete('1.0', tk.END)
+        self.helper_text.insert('1.0', HELPER_TEXT.get(field_type, HELPER_PLACEHOLDER))
+        self.helper_text.config(state=tk.DISABLED)
     
     def load_metadata_list(self):
         """Load list of metadata files"""
-        metadata_dir = Path("metadata")
-        if not metadata_dir.exists():
-            messagebox.showerror("Error", "Metadata directory not found!\n\nExpected: ./metadata/")
+        metadata_dir = self._metadata_dir
+        # One directory read gives names and types; a missing directory shows
+        # up as the error rather than through a separate exists() check
+        try:
+            with os.scandir(metadata_dir) as it:
+                entries = sorted((e for e in it if e.name.endswith('.json') and e.is_file()),
+                                 key=lambda e: e.name)
+        except FileNotFoundError:
+            messagebox.showerror("Error", f"Metadata directory not found!\n\nExpected: {metadata_dir}/")
             return
         
-        self.metadata_files = sorted(metadata_dir.glob("*.json"))
+        previous = set(self.metadata_files)
+        self.metadata_files = [Path(e.path) for e in entries]
+        self._names_lower = [e.name.lower() for e in entries]
+        # mtimes from the listing validate the metadata cache until the next reload
+        self._mtimes = {path: e.stat().st_mtime_ns for path, e in zip(self.metadata_files, entries)}
+        
+        # Every listed file has a row, including rows detached by the filter.
+        # Rows of files still listed are kept and updated, so a reload only
+        # creates and deletes rows for files that came or went
+        gone = previous.difference(self.metadata_files)
+        if gone:
+            self.file_tree.delete(*map(str, gone))
+        
+        # Show the list right away; files that aren't cached yet appear as
+        # pending and are parsed in the background
+        self._load_generation += 1
+        self._reviewed = {path for path in self.metadata_files if self._review_status(path)[0]}
+        for path in self.metadata_files:
+            if path in previous:
+                self.file_tree.item(str(path), values=self._row_values(path))
+            else:
+                self.file_tree.insert('', tk.END, iid=str(path), text=path.name,
+                                      values=self._row_values(path))
+        # update_file_list reattaches the rows in listing order
         self.update_file_list()
         self.update_stats()
+        
+        uncached = [path for path in self.metadata_files if self._cached_meta(path) is None]
+        if uncached:
+            self._load_in_background(uncached)
     
-    def update_file_list(self):
-        """Update the file listbox"""
-        self.file_listbox.delete(0, tk.END)
+    def _cached_meta(self, path: Path) -> Optional[dict]:
+        """Parsed metadata of a file if the cached copy is current, else None"""
+        entry = self._meta_cache.get(path)
+        if entry and entry[0] == self._mtimes.get(path):
+            return entry[1]
+        return None
+    
+    def _get_meta(self, path: Path) -> dict:
+        """
+        Load a metadata file for display, reusing the parsed copy while its
+        mtime is unchanged. The mtime is read now rather than taken from the
+        listing, so a file the tagger rewrote since then is read again.
+        """
+        mtime = self._mtimes[path] = path.stat().st_mtime_ns
+        entry = self._meta_cache.get(path)
+        if entry and entry[0] == mtime:
+            return entry[1]
+        
+        data = read_metadata(path)
+        self._cache_meta(path, mtime, data)
+        return data
+    
+    def _cache_meta(self, path: Path, mtime: int, data: dict):
+        """Cache parsed metadata, formatting its review date once for display"""
+        reviewed, review_date, _ = review_status(data)
+        self._meta_cache[path] = (mtime, data, format_review_date(review_date))
+        if reviewed:
+            self._reviewed.add(path)
+        else:
+            self._reviewed.discard(path)
+        if self.file_tree.exists(str(path)):
+            self.file_tree.item(str(path), values=self._row_values(path))
+    
+    def _load_in_background(self, paths: List[Path]):
+        """
+        Parse metadata files on worker threads.
+        Results are handed back through a queue that the Tk loop polls, since
+        Tk widgets may only be touched from the main thread.
+        """
+        results = queue.Queue()
+        # The listing mtimes the results belong to
+        mtimes = [self._mtimes.get(path) for path in paths]
+        
+        def work():
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for path, mtime, data in zip(paths, mtimes,
+                                             pool.map(read_metadata_or_none, paths)):
+                    results.put((path, mtime, data))
+            results.put(None)
+        
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(50, self._apply_loaded, self._load_generation, results)
+    
+    def _apply_loaded(self, generation: int, results: queue.Queue):
+        """Store background-parsed metadata and redraw the affected rows"""
+        if generation != self._load_generation:
+            return  # The list was reloaded since; these results are stale
+        
+        done = False
+        while True:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+                break
+            path, mtime, data = item
+            # Skip files that were re-read (e.g. selected) since the listing
+            if data is None or mtime is None or self._mtimes.get(path) != mtime:
+                continue
+            self._cache_meta(path, mtime, data)
         
+        if done:
+            self._schedule_refresh()
+        else:
+            self.root.after(50, self._apply_loaded, generation, results)
+    
+    def _review_status(self, path: Path) -> Tuple[bool, str]:
+        """(reviewed, formatted review date) of a cached file; others count as pending"""
+        entry = self._meta_cache.get(path)
+        if entry and entry[0] == self._mtimes.get(path):
+            return review_status(entry[1])[0], entry[2]
+        return False, ''
+    
+    def _row_values(self, meta_file: Path) -> Tuple[str, str]:
+        """(status icon, review date) columns of a file's row"""
+        reviewed, date_str = self._review_status(meta_file)
+        return ("✓", date_str) if reviewed else ("○", "")
+    
+    def update_file_list(self):
+        """Show the rows matching the filter text"""
         filter_text = self.search_var.get().lower()
         
-        for meta_file in self.metadata_files:
-            if filter_text and filter_text not in meta_file.name.lower():
-                continue
-            
-            # Check if reviewed
-            try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    reviewed = data.get('annotation_status', {}).get('human_review_complete', False)
-                    review_date = data.get('annotation_status', {}).get('review_date', '')
-                    
-                    if reviewed and review_date:
-                        # Format date nicely
-                        try:
-                            dt = datetime.fromisoformat(review_date)
-                            date_str = dt.strftime("%Y-%m-%d %H:%M")
-                            icon = "✓"
-                            display_name = f"{icon} {meta_file.name} [{date_str}]"
-                        except:
-                            icon = "✓"
-                            display_name = f"{icon} {meta_file.name}"
-                    elif reviewed:
-                        icon = "✓"
-                        display_name = f"{icon} {meta_file.name}"
-                    else:
-                        icon = "○"
-                        display_name = f"{icon} {meta_file.name}"
-            except:
-                icon = "○"
-                display_name = f"{icon} {meta_file.name}"
-            
-            self.file_listbox.insert(tk.END, display_name)
+        # Rows keep their status up to date themselves, so only a new listing
+        # or a different filter changes which rows are shown
+        if self._shown_list == (filter_text, self._load_generation):
+            return
+        self._shown_list = (filter_text, self._load_generation)
+        
+        # Filter on the name only, so hidden files are never looked at;
+        # set_children reattaches matches in order and detaches the rest
+        self.file_tree.set_children('', *(
+            str(meta_file)
+            for meta_file, name_lower in zip(self.metadata_files, self._names_lower)
+            if not filter_text or filter_text in name_lower
+        ))
     
     def filter_file_list(self):
         """Filter file list based on search text"""
         self.update_file_list()
     
+    def _schedule_filter(self):
+        """Refilter 150 ms after the last keystroke in the filter entry"""
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(150, self._do_filter)
+    
+    def _do_filter(self):
+        """Run the filter scheduled by _schedule_filter"""
+        self._filter_job = None
+        self.filter_file_list()
+    
+    def _schedule_refresh(self):
+        """Refresh the list and stats once at the next idle tick, however often asked"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the refresh queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self.update_file_list()
+        self.update_stats()
+        
+        # Show the new review status, unless the user has already moved on
+        # (on_file_select displays the new file itself) or started editing
+        redisplay, self._redisplay_file = self._redisplay_file, None
+        if redisplay is not None and redisplay == self.current_file and not self.modified:
+            self.display_annotation_fields()
+    
     def update_stats(self):
         """Update statistics label"""
         total = len(self.metadata_files)
-        reviewed = 0
-        
-        for meta_file in self.metadata_files:
-            try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if data.get('annotation_status', {}).get('human_review_complete', False):
-                        reviewed += 1
-            except:
-                pass
+        reviewed = len(self._reviewed)
         
         self.stats_label.config(text=f"Files: {total} | Reviewed: {reviewed} ({reviewed/total*100:.1f}%)" if total > 0 else "Files: 0")
     
     def on_file_select(self, event):
         """Handle file selection"""
-        selection = self.file_listbox.curselection()
+        selection = self.file_tree.selection()
         if not selection:
             return
         
@@ -420,94 +799,71 @@ class AnnotationGUI:
             elif response:  # Yes
                 self.save_current()
         
-        # Get actual file (strip icon and date info)
-        idx = selection[0]
-        display_name = self.file_listbox.get(idx)
-        
-        # Extract just the filename
-        # Format: "✓ filename.json [date]" or "○ filename.json"
-        # Remove icon and space at start
-        filename = display_name[2:] if len(display_name) > 2 else display_name
-        
-        # Remove date part if present
-        if ' [' in filename:
-            filename = filename.split(' [')[0]
-        
-        # Find the actual file
-        for meta_file in self.metadata_files:
-            if meta_file.name == filename:
-                self.current_file = meta_file
-                break
-        
-        if not self.current_file:
-            return
+        # Row ids are the metadata file paths
+        self.current_file = Path(selection[0])
         
         # Load metadata
         try:
-            with open(self.current_file, 'r', encoding='utf-8') as f:
-                self.current_data = json.load(f)
+            self.current_data = self._get_meta(self.current_file)
             
             self.modified = False
             self.display_annotation_fields()
             self.status_var.set(f"Loaded: {self.current_file.name}")
             
             # Find audio file
-            audio_dir = Path("data")
+            audio_dir = self._metadata_dir.parent / "data"
             audio_filename = self.current_data.get('file_info', {}).get('filename', '')
+            self.current_audio_path = None
             if audio_filename:
                 audio_path = audio_dir / audio_filename
                 if audio_path.exists():
                     self.current_audio_path = str(audio_path)
-                else:
-                    self.current_audio_path = None
+                    if self._audio_exec:
+                        self._audio_exec.submit(warm_file, self.current_audio_path)
             
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load file:\n{str(e)}")
     
     def display_annotation_fields(self):
         """Display annotation fields for current file"""
+        if not self.current_data:
+            return
+        
+        # The widgets only depend on the edit mode, so they are built once per
+        # mode and refilled for each file
+        if self._fields_mode != self.edit_mode:
+            self._build_annotation_fields()
+        self._populate_annotation_fields(self.current_data)
+    
+    def _build_annotation_fields(self):
+        """Create the annotation widgets for the current edit mode"""
         # Clear existing widgets
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         
         self.field_widgets = {}
-        
-        if not self.current_data:
-            return
+        # Current value of each selection field, kept in sync by a variable
+        # trace so collecting annotations doesn't query Tcl per field
+        self._field_cache = {}
+        self._combos = {}
+        self._info_labels = {}
+        self._fields_mode = self.edit_mode
         
         # Title
         title_frame = ttk.Frame(self.content_frame)
         title_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Label(title_frame, text=f"Annotating: {self.current_file.name}", 
-                 font=('Arial', 14, 'bold')).pack(side=tk.LEFT)
+        self._title_label = ttk.Label(title_frame, font=('Arial', 14, 'bold'))
+        self._title_label.pack(side=tk.LEFT)
         
         # Review Status Badge
-        reviewed = self.current_data.get('annotation_status', {}).get('human_review_complete', False)
-        review_date = self.current_data.get('annotation_status', {}).get('review_date', '')
-        reviewer = self.current_data.get('annotation_status', {}).get('human_annotator', '')
-        
         status_frame = ttk.Frame(title_frame)
         status_frame.pack(side=tk.RIGHT)
         
-        if reviewed:
-            status_label = ttk.Label(status_frame, text="✓ REVIEWED", 
-                                     font=('Arial', 10, 'bold'), foreground='green')
-            status_label.pack()
-            if review_date:
-                try:
-                    dt = datetime.fromisoformat(review_date)
-                    date_str = dt.strftime("%Y-%m-%d %H:%M")
-                    ttk.Label(status_frame, text=f"Date: {date_str}", 
-                             font=('Arial', 8), foreground='gray').pack()
-                except:
-                    pass
-            if reviewer:
-                ttk.Label(status_frame, text=f"By: {reviewer}", 
-                         font=('Arial', 8), foreground='gray').pack()
-        else:
-            ttk.Label(status_frame, text="○ PENDING REVIEW", 
-                     font=('Arial', 10, 'bold'), foreground='gray').pack()
+        self._status_label = ttk.Label(status_frame, font=('Arial', 10, 'bold'))
+        self._status_label.pack()
+        self._date_label = ttk.Label(status_frame, font=('Arial', 8), foreground='gray')
+        self._reviewer_label = ttk.Label(status_frame, font=('Arial', 8), foreground='gray')
         
         ttk.Separator(self.content_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10, pady=10)
         
@@ -515,22 +871,14 @@ class AnnotationGUI:
         info_frame = ttk.LabelFrame(self.content_frame, text="File Information", padding=10)
         info_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        file_info = self.current_data.get('file_info', {})
-        audio_props = self.current_data.get('audio_properties', {})
-        ttk.Label(info_frame, text=f"Filename: {file_info.get('filename', 'N/A')}").pack(anchor=tk.W)
-        ttk.Label(info_frame, text=f"Duration: {audio_props.get('duration_seconds', 0):.2f}s").pack(anchor=tk.W)
-        ttk.Label(info_frame, text=f"Sample Rate: {audio_props.get('sample_rate', 0)} Hz").pack(anchor=tk.W)
+        for key in ('filename', 'duration', 'sample_rate'):
+            self._info_labels[key] = ttk.Label(info_frame)
+            self._info_labels[key].pack(anchor=tk.W)
         
         # Transcription section - LARGER DISPLAY
         trans_frame = ttk.LabelFrame(self.content_frame, text="Transcription", padding=10)
         trans_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        # Get transcription text
-        text_value = self.current_data.get('text', '')
-        if not text_value:
-            # Fallback to old structure
-            text_value = self.current_data.get('transcription', {}).get('text', 'No transcription available')
-        
         # Create larger text display with scroll
         trans_text_frame = ttk.Frame(trans_frame)
         trans_text_frame.pack(fill=tk.BOTH, expand=True)
@@ -538,78 +886,57 @@ class AnnotationGUI:
         trans_scrollbar = ttk.Scrollbar(trans_text_frame)
         trans_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        trans_text = tk.Text(trans_text_frame, wrap=tk.WORD, height=8, font=('Arial', 12),
-                            yscrollcommand=trans_scrollbar.set, relief=tk.SOLID, borderwidth=1)
-        trans_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        trans_scrollbar.config(command=trans_text.yview)
-        
-        trans_text.insert('1.0', text_value)
-        trans_text.config(state=tk.DISABLED, bg='#f9f9f9')
+        self._trans_text = tk.Text(trans_text_frame, wrap=tk.WORD, height=8, font=('Arial', 12),
+                                   yscrollcommand=trans_scrollbar.set, relief=tk.SOLID, borderwidth=1)
+        self._trans_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        trans_scrollbar.config(command=self._trans_text.yview)
+        self._trans_text.config(state=tk.DISABLED, bg='#f9f9f9')
         
         # Automated tags (read-only or editable based on mode)
         auto_frame = ttk.LabelFrame(self.content_frame, text="Automated Tags", padding=10)
         auto_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        automated = self.current_data.get('automated_tags', {})
-        linguistic = self.current_data.get('linguistic_analysis', {})
-        
         if self.edit_mode == "full":
             # Show all fields as editable
-            self.add_field(auto_frame, "Noise Level", "noise_level", 
-                          automated.get('noise_level', 'unknown'),
-                          ['low_noise', 'medium_noise', 'high_noise'])
+            self.add_field(auto_frame, "Noise Level", "noise_level")
             
-            self.add_field(auto_frame, "Speech Clarity", "speech_clarity",
-                          automated.get('speech_clarity', 'unknown'),
-                          ['clear_speech', 'muffled_speech', 'distorted_speech'])
+            self.add_field(auto_frame, "Speech Clarity", "speech_clarity")
         else:
             # Show as read-only labels
-            ttk.Label(auto_frame, text=f"Noise Level: {automated.get('noise_level', 'N/A')}").pack(anchor=tk.W, pady=2)
-            ttk.Label(auto_frame, text=f"Speech Clarity: {automated.get('speech_clarity', 'N/A')}").pack(anchor=tk.W, pady=2)
-            ttk.Label(auto_frame, text=f"Code-Switching (AI suggestion): {linguistic.get('code_switching', 'N/A')}").pack(anchor=tk.W, pady=2)
+            for key in ('noise_level', 'speech_clarity', 'code_switching'):
+                self._info_labels[key] = ttk.Label(auto_frame)
+                self._info_labels[key].pack(anchor=tk.W, pady=2)
         
         # Manual annotation fields (always editable)
         manual_frame = ttk.LabelFrame(self.content_frame, text="Manual Annotations (Required *)", padding=10)
         manual_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        manual = self.current_data.get('manual_annotations', {})
-        
         # Speaker Gender
         gender_frame = ttk.Frame(manual_frame)
         gender_frame.pack(fill=tk.X, pady=5)
-        self.add_field(gender_frame, "Speaker Gender *", "speaker_gender",
-                      manual.get('speaker_gender', automated.get('speaker_gender', '')),
-                      ['male', 'female', 'child', 'unknown'])
+        self.add_field(gender_frame, "Speaker Gender *", "speaker_gender")
         
         # Code-Switching with helper button
         code_frame = ttk.Frame(manual_frame)
         code_frame.pack(fill=tk.X, pady=5)
         self.add_field(code_frame, "Code-Switching *", "code_switching",
-                      manual.get('code_switching', linguistic.get('code_switching', automated.get('code_switching', ''))),
-                      ['no_code_switching', 'code_switching'],
                       show_helper='code_switching')
         
         # Speaking Style with helper button
         style_frame = ttk.Frame(manual_frame)
         style_frame.pack(fill=tk.X, pady=5)
         self.add_field(style_frame, "Speaking Style *", "speaking_style",
-                      manual.get('speaking_style', automated.get('speaking_style', '')),
-                      ['read_speech', 'spontaneous_speech', 'conversational'],
                       show_helper='speaking_style')
         
         # Dialect
         dialect_frame = ttk.Frame(manual_frame)
         dialect_frame.pack(fill=tk.X, pady=5)
-        self.add_field(dialect_frame, "Dialect *", "dialect",
-                      manual.get('dialect', automated.get('dialect', '')),
-                      ['central_thai', 'northern_thai', 'isan_thai', 'southern_thai', 'other_thai_dialect'])
+        self.add_field(dialect_frame, "Dialect *", "dialect")
         
         # Vocabulary Type with helper button
         vocab_frame = ttk.Frame(manual_frame)
         vocab_frame.pack(fill=tk.X, pady=5)
         self.add_field(vocab_frame, "Vocabulary Type *", "vocabulary_type",
-                      manual.get('vocabulary_type', linguistic.get('vocabulary_type_suggested', automated.get('vocabulary_type', ''))),
-                      ['general_vocab', 'business_vocab', 'medical_vocab', 'technical_vocab', 'mixed_vocab'],
                       show_helper='vocabulary_type')
         
         # Notes
@@ -619,18 +946,96 @@ class AnnotationGUI:
         notes_text = tk.Text(notes_frame, height=4, wrap=tk.WORD, font=('Arial', 10))
         notes_text.pack(fill=tk.X, expand=True)
         
-        existing_notes = self.current_data.get('notes', [])
+        self.field_widgets['notes'] = notes_text
+        # Any change to the text (typing, pasting with the mouse, ...) sets its
+        # modified flag, which raises <<Modified>>
+        notes_text.bind('<<Modified>>', self._on_notes_modified)
+    
+    def _on_notes_modified(self, event):
+        """Mark the file modified when the notes change"""
+        notes_text = event.widget
+        if not notes_text.edit_modified():
+            return  # Raised again by the reset below
+        # Reset the flag so the next change raises <<Modified>> again
+        notes_text.edit_modified(False)
+        self.mark_modified()
+    
+    def _populate_annotation_fields(self, data: Dict):
+        """Fill the annotation widgets with a file's metadata"""
+        self._title_label.config(text=f"Annotating: {self.current_file.name}")
+        
+        # Review Status Badge
+        reviewed, review_date, reviewer = review_status(data)
+        
+        self._date_label.pack_forget()
+        self._reviewer_label.pack_forget()
+        if reviewed:
+            self._status_label.config(text="✓ REVIEWED", foreground='green')
+            entry = self._meta_cache.get(self.current_file)
+            date_str = entry[2] if entry and entry[1] is data else format_review_date(review_date)
+            if date_str:
+                self._date_label.config(text=f"Date: {date_str}")
+                self._date_label.pack()
+            if reviewer:
+                self._reviewer_label.config(text=f"By: {reviewer}")
+                self._reviewer_label.pack()
+        else:
+            self._status_label.config(text="○ PENDING REVIEW", foreground='gray')
+        
+        # File info
+        file_info = data.get('file_info', {})
+        audio_props = data.get('audio_properties', {})
+        self._info_labels['filename'].config(text=f"Filename: {file_info.get('filename', 'N/A')}")
+        self._info_labels['duration'].config(text=f"Duration: {audio_props.get('duration_seconds', 0):.2f}s")
+        self._info_labels['sample_rate'].config(text=f"Sample Rate: {audio_props.get('sample_rate', 0)} Hz")
+        
+        # Get transcription text
+        text_value = data.get('text', '')
+        if not text_value:
+            # Fallback to old structure
+            text_value = data.get('transcription', {}).get('text', 'No transcription available')
+        
+        self._trans_text.config(state=tk.NORMAL)
+        self._trans_text.delete('1.0', tk.END)
+        self._trans_text.insert('1.0', text_value)
+        self._trans_text.config(state=tk.DISABLED)
+        
+        automated = data.get('automated_tags', {})
+        linguistic = data.get('linguistic_analysis', {})
+        manual = data.get('manual_annotations', {})
+        
+        if self.edit_mode == "full":
+            self.set_field("noise_level", automated.get('noise_level', 'unknown'))
+            self.set_field("speech_clarity", automated.get('speech_clarity', 'unknown'))
+        else:
+            self._info_labels['noise_level'].config(text=f"Noise Level: {automated.get('noise_level', 'N/A')}")
+            self._info_labels['speech_clarity'].config(text=f"Speech Clarity: {automated.get('speech_clarity', 'N/A')}")
+            self._info_labels['code_switching'].config(text=f"Code-Switching (AI suggestion): {linguistic.get('code_switching', 'N/A')}")
+        
+        self.set_field("speaker_gender",
+                       manual.get('speaker_gender', automated.get('speaker_gender', '')))
+        self.set_field("code_switching",
+                       manual.get('code_switching', linguistic.get('code_switching', automated.get('code_switching', ''))))
+        self.set_field("speaking_style",
+                       manual.get('speaking_style', automated.get('speaking_style', '')))
+        self.set_field("dialect",
+                       manual.get('dialect', automated.get('dialect', '')))
+        self.set_field("vocabulary_type",
+                       manual.get('vocabulary_type', linguistic.get('vocabulary_type_suggested', automated.get('vocabulary_type', ''))))
+        
+        notes_text = self.field_widgets['notes']
+        notes_text.delete('1.0', tk.END)
+        existing_notes = data.get('notes', [])
         if existing_notes:
             notes_text.insert('1.0', '\n'.join(existing_notes))
-        
-        self.field_widgets['notes'] = notes_text
-        notes_text.bind('<KeyRelease>', lambda e: self.mark_modified())
+        # Filling in the notes is not an edit
+        notes_text.edit_modified(False)
         
         # Show initial helper text
         self.show_helper_text(None)
     
-    def add_field(self, parent, label, field_name, current_value, options, show_helper=None):
-        """Add a selection field"""
+    def add_field(self, parent, label, field_name, show_helper=None):
+        """Add a selection field with the OPTIONS of field_name; its value is set with set_field"""
         field_frame = ttk.Frame(parent)
         field_frame.pack(fill=tk.X, pady=2)
         
@@ -645,25 +1050,16 @@ class AnnotationGUI:
                                  command=lambda: self.show_helper_text(show_helper))
             help_btn.pack(side=tk.LEFT, padx=2)
         
-        # Ensure current_value is in options, otherwise use first option or empty
-        if current_value and current_value not in options:
-            print(f"Warning: Value '{current_value}' not in options for {field_name}. Using empty.")
-            current_value = ''
-        
-        var = tk.StringVar(value=current_value if current_value else '')
+        var = tk.StringVar(value='')
         self.field_widgets[field_name] = var
+        self._field_cache[field_name] = ''
+        var.trace_add('write', lambda *args, fn=field_name, v=var:
+                      self._field_cache.__setitem__(fn, v.get()))
         
-        combo = ttk.Combobox(field_frame, textvariable=var, values=options, 
+        combo = ttk.Combobox(field_frame, textvariable=var, values=OPTIONS[field_name], 
                             state='readonly', width=30)
         combo.pack(side=tk.LEFT, padx=5)
-        
-        # Set the current selection by index if value exists
-        if current_value and current_value in options:
-            try:
-                index = options.index(current_value)
-                combo.current(index)
-            except ValueError:
-                pass
+        self._combos[field_name] = combo
         
         combo.bind('<<ComboboxSelected>>', lambda e: self.mark_modified())
         
@@ -671,11 +1067,27 @@ class AnnotationGUI:
         if show_helper:
             combo.bind('<FocusIn>', lambda e: self.show_helper_text(show_helper))
     
+    def set_field(self, field_name, current_value):
+        """Set the value of a selection field created by add_field"""
+        index = OPTION_INDEX[field_name].get(current_value)
+        
+        # Ensure current_value is in options, otherwise use empty
+        if current_value and index is None:
+            print(f"Warning: Value '{current_value}' not in options for {field_name}. Using empty.")
+        
+        if index is not None:
+            self._combos[field_name].current(index)
+        else:
+            self.field_widgets[field_name].set('')
+    
     def mark_modified(self):
         """Mark current file as modified"""
+        # Runs on every change to the notes; only the first one changes anything.
+        # Loading or saving a file clears the flag and replaces the status text.
+        if self.modified:
+            return
         self.modified = True
-        if not self.status_var.get().endswith(" *"):
-            self.status_var.set(self.status_var.get() + " *")
+        self.status_var.set(self.status_var.get() + " *")
     
     def change_edit_mode(self):
         """Change edit mode"""
@@ -689,7 +1101,7 @@ class AnnotationGUI:
         
         for field_name, widget in self.field_widgets.items():
             if isinstance(widget, tk.StringVar):
-                annotations[field_name] = widget.get()
+                annotations[field_name] = self._field_cache[field_name]
             elif isinstance(widget, tk.Text):
                 value = widget.get('1.0', tk.END).strip()
                 if field_name == 'notes':
@@ -706,9 +1118,18 @@ class AnnotationGUI:
         if not self.current_file or not self.current_data:
             return
         
+        # Nothing edited and already reviewed: rewriting would only bump the date
+        if not self.modified and review_status(self.current_data)[0]:
+            self.status_var.set("No changes")
+            return
+        
         # Collect annotations
         annotations = self.collect_annotations()
         
+        # current_data is the cached dict; drop it before editing so a failed
+        # save doesn't leave the cache out of step with the file
+        self._meta_cache.pop(self.current_file, None)
+        
         # Ensure proper structure
         if 'automated_tags' not in self.current_data:
             self.current_data['automated_tags'] = {}
@@ -721,7 +1142,7 @@ class AnnotationGUI:
         for key, value in annotations.items():
             if key == 'notes':
                 self.current_data['notes'] = value
-            elif self.edit_mode == "full" and key in ['noise_level', 'speech_clarity']:
+            elif self.edit_mode == "full" and key in FULL_MODE_OVERRIDES:
                 # In full mode, can override these automated tags only
                 self.current_data['automated_tags'][key] = value
             else:
@@ -730,40 +1151,51 @@ class AnnotationGUI:
         
         # Update annotation status with timestamp
         self.current_data['annotation_status']['human_review_complete'] = True
-        self.current_data['annotation_status']['human_annotator'] = os.getlogin()
-        self.current_data['annotation_status']['review_date'] = datetime.now().isoformat()
+        self.current_data['annotation_status']['human_annotator'] = self._annotator
+        self.current_data['annotation_status']['review_date'] = time.strftime('%Y-%m-%dT%H:%M:%S')
         
-        # Save to file
+        # Save to file. Write a temporary file and rename it over the
+        # original, so a crash mid-save can't leave a truncated metadata file;
+        # the rename is atomic, so no fsync is needed per save
+        tmp_path = self.current_file.with_suffix('.json.tmp')
         try:
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_data, f, ensure_ascii=False, indent=2)
+            # Encode in memory first and size the buffer to the payload, so
+            # the file gets a single write() instead of one per 8 KiB chunk
+            payload = dump_metadata(self.current_data)
+            with open(tmp_path, 'wb', buffering=max(1 << 16, len(payload) + 4096)) as f:
+                f.write(payload)
+            os.replace(tmp_path, self.current_file)
+            # What was just written is current; cache it under the new mtime
+            mtime = self._mtimes[self.current_file] = self.current_file.stat().st_mtime_ns
+            self._cache_meta(self.current_file, mtime, self.current_data)
             
             self.modified = False
+            # _cache_meta already updated this file's row in place; the counts
+            # and review status are refreshed once the UI is idle, so Save & Next
+            # doesn't redraw a file it is about to leave
             self.status_var.set(f"Saved: {self.current_file.name}")
-            self.update_file_list()
-            self.update_stats()
-            
-            # Refresh display to show updated review status
-            self.display_annotation_fields()
-            
-            messagebox.showinfo("Saved", "Annotations saved successfully!")
+            self._redisplay_file = self.current_file
+            self._schedule_refresh()
             
         except Exception as e:
+            # Don't leave a half-written temporary file next to the metadata
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             messagebox.showerror("Save Error", f"Failed to save:\n{str(e)}")
     
     def save_and_next(self):
         """Save and move to next file"""
         self.save_current()
         
-        # Find next file
-        selection = self.file_listbox.curselection()
+        # Find next file; selecting it loads it via <<TreeviewSelect>>
+        selection = self.file_tree.selection()
         if selection:
-            idx = selection[0]
-            if idx < self.file_listbox.size() - 1:
-                self.file_listbox.selection_clear(0, tk.END)
-                self.file_listbox.selection_set(idx + 1)
-                self.file_listbox.see(idx + 1)
-                self.on_file_select(None)
+            next_row = self.file_tree.next(selection[0])
+            if next_row:
+                self.file_tree.selection_set(next_row)
+                self.file_tree.see(next_row)
     
     def play_audio(self):
         """Play audio file"""
@@ -777,7 +1209,10 @@ class AnnotationGUI:
             return
         
         try:
-            pygame.mixer.music.load(self.current_audio_path)
+            # Replaying the same clip only restarts it; load() reopens the file
+            if self._loaded_audio_path != self.current_audio_path:
+                pygame.mixer.music.load(self.current_audio_path)
+                self._loaded_audio_path = self.current_audio_path
             pygame.mixer.music.play()
             self.status_var.set("Playing audio...")
         except Exception as e:
@@ -793,77 +1228,33 @@ class AnnotationGUI:
         """Open a different metadata directory"""
         directory = filedialog.askdirectory(title="Select Metadata Directory")
         if directory:
-            os.chdir(directory)
+            # Accept either the metadata directory itself or the project
+            # directory containing it
+            directory = Path(directory)
+            if (directory / "metadata").is_dir():
+                directory = directory / "metadata"
+            self._metadata_dir = directory
             self.load_metadata_list()
     
     def show_instructions(self):
         """Show instructions dialog"""
-        instructions = """
-Thai STT Annotation Tool - Instructions
-
-GETTING STARTED:
-1. Audio files should be in 'data' directory
-2. Metadata files should be in 'metadata' directory
-3. Select a file from the left panel to begin
-
-EDIT MODES:
-• Partial Mode (Default): Shows only fields requiring manual review
-  - Speaker gender, dialect, speaking style, vocabulary type
-  - Quick annotation for essential fields only
-
-• Full Mode: Shows all fields including automated tags
-  - Use for detailed review or corrections
-  - Can override any automated classification
-
-REQUIRED FIELDS (marked with *):
-• Code-Switching: Confirm or change AI suggestion (? for help)
-• Speaking Style: Confirm or change AI suggestion (? for help)
-• Dialect: central_thai/northern_thai/isan_thai/southern_thai
-• Vocabulary Type: Confirm or change AI suggestion (? for help)
-
-HELPER BUTTONS (?):
-• Click the "?" button next to Code-Switching, Speaking Style or Vocabulary Type
-• Detailed guidelines appear in the right panel
-• Helps you make accurate classifications
-
-AUDIO PLAYBACK:
-• Click ▶ Play to listen to the audio
-• Click ■ Stop to stop playback
-• Make sure audio file exists in 'data' directory
-
-REVIEW STATUS:
-• Files marked ✓ are reviewed (shows date/time)
-• Files marked ○ are pending review
-• Your annotations are timestamped automatically
-
-SAVING:
-• Ctrl+S: Save current file
-• Ctrl+N: Save and move to next file
-• F11: Toggle fullscreen
-• 💾 Save button: Save without moving
-• 💾 Save & Next button: Save and go to next
-
-STATUS INDICATORS:
-• ✓ = Reviewed (green) with timestamp
-• ○ = Pending review (gray)
-• * = Unsaved changes
-
-NOTES:
-• Add any observations or issues in the Notes section
-• Notes are saved with the annotations
-• Use for documenting unusual cases or problems
-        """
+        # The dialog is built once and hidden on close, then reshown
+        if self._instructions_win is not None and self._instructions_win.winfo_exists():
+            self._instructions_win.deiconify()
+            self._instructions_win.lift()
+            return
         
-        dialog = tk.Toplevel(self.root)
+        dialog = self._instructions_win = tk.Toplevel(self.root)
         dialog.title("Instructions")
         dialog.geometry("700x600")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
         
         text_widget = tk.Text(dialog, wrap=tk.WORD, padx=10, pady=10, font=('Arial', 10))
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert('1.0', instructions)
+        text_widget.insert('1.0', INSTRUCTIONS_TEXT)
         text_widget.config(state=tk.DISABLED)
         
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
+        ttk.Button(dialog, text="Close", command=dialog.withdraw).pack(pady=10)
     
     def show_about(self):
         """Show about dialog"""
@@ -888,6 +1279,7 @@ NOTES:
                 self.save_current()
         
         if AUDIO_AVAILABLE:
+            self._audio_exec.shutdown(wait=False)
             pygame.mixer.quit()
         
         self.root.destroy()
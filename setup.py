@@ -6,12 +6,15 @@ Install with: pip install -e .
 Or: python setup.py install
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read the contents of README file
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+try:
+    long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+except FileNotFoundError:
+    long_description = ""
 
 setup(
     name="thai-stt-auto-tagger",
@@ -27,7 +30,8 @@ setup(
         "Source": "https://github.com/yourusername/thai-stt-auto-tagger",  # UPDATE THIS
         "Documentation": "https://github.com/yourusername/thai-stt-auto-tagger/tree/main/docs",  # UPDATE THIS
     },
-    packages=find_packages(exclude=["tests", "docs", "examples"]),
+    # The tools are single-file modules, not packages
+    py_modules=["thai_stt_auto_tagger", "annotation_gui"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -65,6 +69,9 @@ setup(
         "gui": [
             "pygame>=2.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
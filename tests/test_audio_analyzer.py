@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import thai_stt_auto_tagger as tagger
+
+
+@pytest.fixture
+def speech_like_wav(tmp_path):
+    """70 s of a tone switched on and off over faint noise, so there are pauses"""
+    sr = 16000
+    t = np.arange(sr * 70) / sr
+    rng = np.random.default_rng(0)
+    y = (0.3 * np.sin(2 * np.pi * 180 * t) * (np.sin(2 * np.pi * 0.3 * t) > 0)
+         + 0.001 * rng.standard_normal(t.size))
+    path = tmp_path / "speech.wav"
+    sf.write(path, y.astype(np.float32), sr, subtype='FLOAT')
+    return str(path)
+
+
+def test_streamed_analysis_matches_in_memory(speech_like_wav, monkeypatch):
+    """Analyzing a file block by block gives the tags of analyzing it whole"""
+    monkeypatch.setattr(tagger, "VERBOSITY", tagger.QUIET)
+    analyzer = tagger.AudioAnalyzer(sample_rate=16000)
+
+    assert not analyzer.should_stream(speech_like_wav)
+    whole = analyzer.analyze_file(speech_like_wav, {})
+
+    analyzer.STREAM_MIN_SECONDS = 1
+    assert analyzer.should_stream(speech_like_wav)
+    # Blocks shorter than the file, so frames straddle block edges
+    streamed = analyzer.analyze_file(speech_like_wav, {})
+
+    for key in ('duration', 'sample_rate', 'noise_level', 'speech_clarity',
+                'speaking_style'):
+        assert streamed[key] == whole[key], key
+    assert streamed['snr_db'] == pytest.approx(whole['snr_db'], rel=1e-6)
+    assert streamed['voice_activity'] == pytest.approx(whole['voice_activity'])
+    for group in ('clarity_features', 'style_features'):
+        for key, value in whole[group].items():
+            assert streamed[group][key] == pytest.approx(value, rel=1e-5), key
+    assert whole['style_features']['pause_count'] > 0
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import LAUNCH
+
+
+NAMES = ["a.mp3", "b.mp3"]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """A launcher directory with two data files and a fixed tagger version"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    for name in NAMES:
+        (tmp_path / "data" / name).write_bytes(name.encode())
+    monkeypatch.setattr(LAUNCH, "_tagger_version", hashlib.blake2b(b"tagger", digest_size=8))
+    return tmp_path
+
+
+def write_metadata(name, content):
+    LAUNCH.metadata_path(name).write_text(json.dumps(content), encoding='utf-8')
+
+
+def read_metadata(name):
+    return json.loads(LAUNCH.metadata_path(name).read_text(encoding='utf-8'))
+
+
+def fake_tagger(monkeypatch, mode):
+    """Stand in for the persistent worker, recording the files of each job"""
+    jobs = []
+
+    def send_job(job):
+        files = job.get('files', NAMES)
+        jobs.append(files)
+        for name in files:
+            write_metadata(name, {'mode': mode})
+        return True
+
+    monkeypatch.setattr(LAUNCH, "send_job", send_job)
+    return jobs
+
+
+def test_filter_cached_hit_and_miss(workdir):
+    conn = LAUNCH.open_cache()
+    assert LAUNCH.filter_cached(conn, NAMES, "full") == NAMES
+
+    for name in NAMES:
+        write_metadata(name, {'mode': 'full'})
+    LAUNCH.store_results(conn, NAMES, "full", since=0)
+    assert LAUNCH.filter_cached(conn, NAMES, "full") == []
+    # Another mode has its own results
+    assert LAUNCH.filter_cached(conn, NAMES, "fast") == NAMES
+
+    # Changed audio content is a miss
+    (workdir / "data" / "a.mp3").write_bytes(b"new audio")
+    assert LAUNCH.filter_cached(conn, NAMES, "full") == ["a.mp3"]
+    conn.close()
+
+
+def test_filter_cached_restores_replaced_metadata(workdir):
+    conn = LAUNCH.open_cache()
+    for name in NAMES:
+        write_metadata(name, {'mode': 'full'})
+    LAUNCH.store_results(conn, NAMES, "full", since=0)
+
+    # A run in another mode overwrites the metadata; b.mp3 is then reviewed
+    write_metadata("a.mp3", {'mode': 'fast'})
+    reviewed = {'mode': 'fast', 'annotation_status': {'human_review_complete': True}}
+    write_metadata("b.mp3", reviewed)
+    LAUNCH.metadata_path("a.mp3").unlink()
+
+    assert LAUNCH.filter_cached(conn, NAMES, "full") == []
+    assert read_metadata("a.mp3") == {'mode': 'full'}
+    assert read_metadata("b.mp3") == reviewed
+    conn.close()
+
+
+def test_run_batch_skips_cached_files_unless_forced(workdir, monkeypatch):
+    jobs = fake_tagger(monkeypatch, "fast")
+    assert LAUNCH.run_batch(NAMES, [], {}, 1, "fast")
+    assert LAUNCH.run_batch(NAMES, [], {}, 1, "fast")
+    assert jobs == [NAMES]
+
+    assert LAUNCH.run_batch(NAMES, [], {}, 1, "fast", force=True)
+    assert jobs == [NAMES, NAMES]
+
+    # Only the changed file is sent
+    (workdir / "data" / "b.mp3").write_bytes(b"new audio")
+    assert LAUNCH.run_batch(NAMES, [], {}, 1, "fast")
+    assert jobs == [NAMES, NAMES, ["b.mp3"]]
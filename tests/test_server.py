@@ -0,0 +1,39 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import thai_stt_auto_tagger as tagger
+
+
+def test_serve_round_trip(tmp_path, monkeypatch, capsys):
+    """An audio-only job writes metadata and ends with a result marker line"""
+    sr = 16000
+    t = np.arange(sr * 3) / sr
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    sf.write(data_dir / "clip.wav", (0.3 * np.sin(2 * np.pi * 180 * t)).astype(np.float32), sr)
+
+    jobs = [
+        {"input": str(data_dir), "files": ["clip.wav"], "no_transcription": True,
+         "output": str(tmp_path / "metadata")},
+        {"input": str(data_dir), "files": ["missing.wav"], "no_transcription": True,
+         "output": str(tmp_path / "metadata")},
+    ]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(json.dumps(job) + "\n" for job in jobs)))
+    monkeypatch.setattr(tagger, "VERBOSITY", tagger.QUIET)
+
+    tagger.serve()
+
+    results = [json.loads(line[len(tagger.SERVER_RESULT_MARKER):])
+               for line in capsys.readouterr().out.splitlines()
+               if line.startswith(tagger.SERVER_RESULT_MARKER)]
+    assert results == [{'ok': True}, {'ok': False}]
+    metadata = json.loads((tmp_path / "metadata" / "clip_metadata.json").read_text(encoding='utf-8'))
+    assert metadata['file_info']['filename'] == "clip.wav"
+    assert metadata['audio_properties']['duration_seconds'] == 3.0
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+whisper = pytest.importorskip("whisper")
+
+import thai_stt_auto_tagger as tagger
+
+
+def test_transcribe_batch_loads_path_without_decoded_audio(monkeypatch):
+    """A Path with no decoded signal is loaded before it reaches the model"""
+    long_audio = np.zeros(whisper.audio.N_SAMPLES + 1, dtype=np.float32)
+    loaded = []
+
+    def load_audio(path):
+        loaded.append(path)
+        return long_audio
+
+    monkeypatch.setattr(whisper, "load_audio", load_audio)
+    monkeypatch.setattr(tagger, "WHISPER_AVAILABLE", True)
+
+    transcriber = tagger.SpeechTranscriber.__new__(tagger.SpeechTranscriber)
+    transcriber.backend = "openai-whisper"
+    transcriber.model = SimpleNamespace(dims=SimpleNamespace(n_mels=80))
+    transcriber.compute_type = "float32"
+
+    received = []
+
+    def transcribe(audio):
+        received.append(audio)
+        return {'text': "สวัสดี", 'language': 'th', 'segments': []}
+
+    monkeypatch.setattr(transcriber, "transcribe", transcribe)
+
+    results = transcriber.transcribe_batch([Path("data") / "long.mp3"])
+
+    assert loaded == [str(Path("data") / "long.mp3")]
+    assert isinstance(received[0], np.ndarray)
+    assert results[0]['text'] == "สวัสดี"
@@ -14,13 +14,20 @@ Usage:
 """
 
 import os
+import sys
 import json
 import argparse
+import fnmatch
+import functools
+import hashlib
 import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import time
+import traceback
 
 import numpy as np
 import librosa
@@ -29,33 +36,113 @@ from pydub import AudioSegment
 
 warnings.filterwarnings('ignore')
 
+# Output levels, set from --quiet / --verbose
+QUIET, NORMAL, VERBOSE = 0, 1, 2
+VERBOSITY = NORMAL
+
+# Separator lines for the progress output
+RULE = '=' * 70
+THIN_RULE = '─' * 70
+SHORT_RULE = '─' * 35
+BAR = '█' * 70
+
+# Per-file timing stages, in the order of the stage statistics columns
+TIMING_STAGES = {
+    'load_audio': "Audio Loading",
+    'snr': "SNR Analysis",
+    'clarity': "Clarity Analysis",
+    'style': "Style Detection",
+    'transcription': "Transcription",
+    'linguistic': "Linguistic Analysis",
+    'metadata': "Metadata Generation",
+    'save': "Metadata Save",
+}
+
+# normalization_notes of text that normalization left as it was
+UNCHANGED_NORMALIZATION_NOTE = "No changes made - text is already in standard form"
+
+def set_verbosity(level: int):
+    """Set how much progress output is printed: QUIET, NORMAL or VERBOSE"""
+    global VERBOSITY
+    VERBOSITY = level
+
 # Progress tracking utilities
 def print_progress(message, level=0):
-    """Print progress message with indentation"""
+    """Print progress message with indentation (not in quiet mode)"""
+    if VERBOSITY < NORMAL:
+        return
     indent = "  " * level
     timestamp = datetime.now().strftime("%H:%M:%S")
     print(f"[{timestamp}] {indent}{message}")
 
+def print_detail(*args, **kwargs):
+    """print() for banners and separators, which quiet mode leaves out"""
+    if VERBOSITY >= NORMAL:
+        print(*args, **kwargs)
+
 def time_operation(func):
     """Decorator to time operations"""
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         return result, elapsed
     return wrapper
 
+def get_audio_duration(file_path: str) -> float:
+    """Read an audio file's duration from its header without decoding it"""
+    try:
+        return sf.info(file_path).duration
+    except Exception:
+        return librosa.get_duration(path=file_path)
+
+def iter_audio_files(input_dir: str, pattern: str = "*.mp3") -> Iterator[str]:
+    """
+    Yield paths of the files in input_dir whose names match pattern
+    
+    Plain name patterns are matched against a single os.scandir pass, which
+    yields strings instead of a Path per entry; patterns with a directory
+    part (e.g. "**/*.mp3") go through Path.glob.
+    """
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        for path in Path(input_dir).glob(pattern):
+            yield str(path)
+        return
+    try:
+        entries = os.scandir(input_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return  # Like glob, a missing directory just has no matches
+    with entries:
+        for entry in entries:
+            if fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                yield entry.path
+
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg() -> Optional[str]:
+    """Path of the ffmpeg executable, or None; looked up once per process"""
+    import shutil
+    return shutil.which('ffmpeg')
+
 # Try to import optional dependencies
 try:
     import whisper
-    WHISPER_AVAILABLE = True
+    OPENAI_WHISPER_AVAILABLE = True
 except ImportError:
-    WHISPER_AVAILABLE = False
+    OPENAI_WHISPER_AVAILABLE = False
+
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+WHISPER_AVAILABLE = OPENAI_WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE
+if not WHISPER_AVAILABLE:
     print("Warning: whisper not installed. Transcription will be skipped.")
-    print("Install with: pip install openai-whisper")
+    print("Install with: pip install openai-whisper (or faster-whisper)")
 
 try:
-    from pythainlp.util import normalize
+    from pythainlp.util import normalize, remove_dup_spaces, remove_zw
     from pythainlp.tokenize import word_tokenize
     PYTHAINLP_AVAILABLE = True
 except ImportError:
@@ -63,32 +150,142 @@ except ImportError:
     print("Warning: pythainlp not installed. Thai text processing will be limited.")
     print("Install with: pip install pythainlp")
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _pause_stats(intervals: np.ndarray, sr: int, min_pause: float) -> Tuple[int, float]:
+    """(count, mean duration) of the gaps between intervals longer than min_pause seconds"""
+    count = 0
+    total = 0.0
+    for i in range(intervals.shape[0] - 1):
+        pause_duration = (intervals[i + 1, 0] - intervals[i, 1]) / sr
+        if pause_duration > min_pause:
+            count += 1
+            total += pause_duration
+    return count, (total / count if count else 0.0)
+
+
+if NUMBA_AVAILABLE:
+    # Compiled once per interval dtype and cached on disk
+    _pause_stats = numba.njit(cache=True)(_pause_stats)
+
 
 class AudioAnalyzer:
     """Analyzes audio files for acoustic properties"""
     
-    def __init__(self, sample_rate: int = 16000):
+    # Files at least this long (in seconds) are analyzed in blocks
+    STREAM_MIN_SECONDS = 20 * 60
+    
+    def __init__(self, sample_rate: int = 16000, feature_rate: Optional[int] = None,
+                 cache_dir: Optional[str] = None):
         self.sample_rate = sample_rate
+        # Rate the acoustic features are computed at; None uses the load rate
+        self.feature_rate = feature_rate
+        # Directory of decoded signals (.npy) to reuse on later runs; None disables it
+        self.cache_dir = cache_dir
+        # Mel filterbanks by (sr, n_fft); librosa rebuilds them on every call
+        self._mel_filters: Dict[Tuple[int, int], np.ndarray] = {}
     
-    def load_audio(self, file_path: str) -> Tuple[np.ndarray, int]:
-        """Load audio file and convert to mono"""
+    def mel_spectrogram(self, power: np.ndarray, sr: int) -> np.ndarray:
+        """Mel spectrogram (librosa's default 128 bands) from a power spectrogram"""
+        n_fft = 2 * (power.shape[0] - 1)
+        mel_filters = self._mel_filters.get((sr, n_fft))
+        if mel_filters is None:
+            mel_filters = self._mel_filters[sr, n_fft] = librosa.filters.mel(sr=sr, n_fft=n_fft)
+        return mel_filters @ power
+    
+    def feature_signal(self, y: np.ndarray, sr: int) -> Tuple[np.ndarray, int]:
+        """
+        Signal to compute acoustic features on: y decimated to feature_rate
+        when that is set and lower than sr, otherwise y itself
+        """
+        if not self.feature_rate or self.feature_rate >= sr:
+            return y, sr
+        return librosa.resample(y, orig_sr=sr, target_sr=self.feature_rate,
+                                res_type='soxr_hq'), self.feature_rate
+    
+    def load_audio(self, file_path: str,
+                   file_size: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """Load audio file and convert to mono
+        
+        Callers that have already stat'ed the file pass file_size so it
+        isn't stat'ed again.
+        """
         import os
         
         # Check file exists and get info
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        if file_size is None:
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {file_path}")
         
-        file_size = os.path.getsize(file_path)
         file_size_mb = file_size / (1024 * 1024)
         print_progress(f"File size: {file_size_mb:.2f} MB", 1)
         
-        # Try librosa first (recommended method)
+        # Read directly with soundfile when libsndfile knows the format (WAV,
+        # FLAC, OGG, and MP3 with libsndfile >= 1.1); librosa below also
+        # handles formats that need audioread/FFmpeg
+        try:
+            data, file_sr = sf.read(file_path, dtype='float32', always_2d=True)
+        except RuntimeError:
+            pass
+        else:
+            y = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+            if file_sr != self.sample_rate:
+                y = librosa.resample(y, orig_sr=file_sr, target_sr=self.sample_rate)
+            print_progress(f"✓ Loaded {len(y)/self.sample_rate:.1f}s of audio with soundfile", 1)
+            return y, self.sample_rate
+        
+        # Then an FFmpeg pipe, which decodes, downmixes and resamples in one
+        # step and hands back float32 samples ready to use
+        if find_ffmpeg():
+            try:
+                y = self._load_with_ffmpeg(file_path)
+            except KeyboardInterrupt:
+                print_progress("⚠ Loading interrupted by user", 1)
+                raise
+            except Exception as e:
+                print_progress(f"⚠ FFmpeg pipe failed: {str(e)[:80]}", 1)
+            else:
+                print_progress(f"✓ Loaded {len(y)/self.sample_rate:.1f}s of audio with FFmpeg", 1)
+                return y, self.sample_rate
+        
+        # Then librosa
         try:
             print_progress("Attempting to load with librosa...", 1)
             print_progress("(This may take 10-30 seconds for large files)", 2)
             
             # Use a shorter hop_length for faster loading
-            y, sr = librosa.load(file_path, sr=self.sample_rate, mono=True)
+            y, sr = librosa.load(file_path, sr=self.sample_rate, mono=True, dtype=np.float32)
             
             print_progress(f"✓ Loaded {len(y)/sr:.1f}s of audio", 2)
             print_progress(f"✓ Sample rate: {sr} Hz", 2)
@@ -107,8 +304,15 @@ class AudioAnalyzer:
                 print_progress("⚠ This appears to be an FFmpeg issue", 2)
                 print_progress("  Install FFmpeg and try again", 2)
             
-            # Fallback to pydub for MP3
+            # Fallback to PyAV, which decodes in-process with the bundled
+            # FFmpeg libraries, then to pydub
             try:
+                if AV_AVAILABLE:
+                    print_progress("Attempting to load with PyAV (fallback)...", 1)
+                    samples = self._load_with_av(file_path)
+                    print_progress(f"✓ Loaded {len(samples)/self.sample_rate:.1f}s of audio", 2)
+                    return samples, self.sample_rate
+                
                 print_progress("Attempting to load with pydub (fallback)...", 1)
                 print_progress("(This may take longer)", 2)
                 
@@ -130,17 +334,18 @@ class AudioAnalyzer:
                 
             except Exception as e2:
                 error_msg2 = str(e2)
-                print_progress(f"❌ pydub also failed: {error_msg2[:80]}", 1)
+                fallback = 'PyAV' if AV_AVAILABLE else 'pydub'
+                print_progress(f"❌ {fallback} also failed: {error_msg2[:80]}", 1)
                 print()
-                print(f"{'='*70}")
+                print(f"{RULE}")
                 print(f"ERROR: Could not load audio file")
-                print(f"{'='*70}")
+                print(f"{RULE}")
                 print(f"File: {file_path}")
                 print(f"Size: {file_size_mb:.2f} MB")
                 print()
                 print("Error details:")
                 print(f"  librosa: {error_msg}")
-                print(f"  pydub:   {error_msg2}")
+                print(f"  {fallback + ':':<9}{error_msg2}")
                 print()
                 print("Possible causes:")
                 print("  • FFmpeg is not installed or not in PATH")
@@ -159,30 +364,130 @@ class AudioAnalyzer:
                 print()
                 print("  3. Check if file is corrupted:")
                 print(f"     Try playing it in a media player")
-                print(f"{'='*70}")
+                print(f"{RULE}")
                 raise RuntimeError(f"Failed to load audio file: {file_path}")
+
+    def _load_with_ffmpeg(self, file_path: str) -> np.ndarray:
+        """Decode with an ffmpeg subprocess straight to mono float32 at sample_rate"""
+        import subprocess
+        
+        result = subprocess.run(
+            [find_ffmpeg(), '-nostdin', '-v', 'error', '-i', file_path,
+             '-ac', '1', '-ar', str(self.sample_rate), '-f', 'f32le', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip()
+                               or f"ffmpeg exited with code {result.returncode}")
+        if not result.stdout:
+            raise RuntimeError(f"No audio decoded from {file_path}")
+        # A read-only view of ffmpeg's output, with no further copy
+        return np.frombuffer(result.stdout, dtype=np.float32)
+    
+    def _load_with_av(self, file_path: str) -> np.ndarray:
+        """Decode the first audio stream with PyAV as mono float32 at sample_rate"""
+        # libswresample downmixes, resamples and converts to packed float32
+        # while decoding, whatever the stream's own layout and sample format
+        resampler = av.AudioResampler(format='flt', layout='mono', rate=self.sample_rate)
+        chunks = []
+        with av.open(file_path) as container:
+            stream = container.streams.audio[0]
+            for frame in container.decode(stream):
+                for out in resampler.resample(frame):
+                    chunks.append(out.to_ndarray()[0])
+            for out in resampler.resample(None):
+                chunks.append(out.to_ndarray()[0])
+        if not chunks:
+            raise RuntimeError(f"No audio decoded from {file_path}")
+        return np.concatenate(chunks)
+
+    def spectrogram(self, y: np.ndarray, n_fft: int = 2048,
+                    hop_length: int = 512) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Magnitude and power spectrograms of y from a single STFT, so the
+        spectral features can share one transform
+        """
+        stft = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
+        power = stft.real ** 2 + stft.imag ** 2
+        return np.sqrt(power), power
+    
+    def spectrogram_frames(self, y: np.ndarray, n_fft: int = 2048,
+                           hop_length: int = 512) -> Tuple[np.ndarray, np.ndarray]:
+        """Like spectrogram, but only over the frames that fit entirely inside y"""
+        stft = librosa.stft(y, n_fft=n_fft, hop_length=hop_length, center=False)
+        power = stft.real ** 2 + stft.imag ** 2
+        return np.sqrt(power), power
+    
+    def frame_rms(self, y: np.ndarray, frame_length: int = 2048,
+                  hop_length: int = 512, center: bool = True) -> np.ndarray:
+        """
+        RMS energy per frame, matching librosa.feature.rms (centered,
+        zero-padded frames unless center is False) but computed from a
+        running sum of squares instead of materializing every frame
+        """
+        pad = frame_length // 2 if center else 0
+        squares = np.zeros(len(y) + 2 * pad + 1)
+        np.square(y, out=squares[pad + 1:pad + 1 + len(y)])
+        cumulative = np.cumsum(squares, out=squares)
+        starts = np.arange(0, len(y) + 2 * pad - frame_length + 1, hop_length)
+        power = (cumulative[starts + frame_length] - cumulative[starts]) / frame_length
+        return np.sqrt(np.maximum(power, 0)).astype(np.float32)
+    
+    @staticmethod
+    def zero_crossing_counts(y: np.ndarray, frame_length: int = 2048,
+                             hop_length: int = 512) -> np.ndarray:
+        """
+        Zero crossings in each frame that fits entirely inside y (as
+        librosa.feature.zero_crossing_rate with center=False, times
+        frame_length), from a running count of crossings instead of
+        materializing every frame
+        """
+        # Samples within librosa's default threshold count as zero, which is positive
+        negative = y < -1e-10
+        crossings = np.zeros(len(y), dtype=np.int32)
+        np.not_equal(negative[1:], negative[:-1], out=crossings[1:], casting='unsafe')
+        cumulative = np.cumsum(crossings, out=crossings)
+        starts = np.arange(0, len(y) - frame_length + 1, hop_length)
+        # A frame counts the crossings between its own samples
+        return cumulative[starts + frame_length - 1] - cumulative[starts]
+    
+    @classmethod
+    def mean_zero_crossing_rate(cls, y: np.ndarray, frame_length: int = 2048,
+                                hop_length: int = 512) -> float:
+        """
+        Mean of librosa.feature.zero_crossing_rate(y) over its (centered,
+        edge-padded) frames
+        """
+        counts = cls.zero_crossing_counts(np.pad(y, frame_length // 2, mode='edge'),
+                                          frame_length, hop_length)
+        return float(counts.sum() / (frame_length * len(counts)))
     
     def calculate_snr(self, y: np.ndarray, frame_length: int = 2048, 
-                      hop_length: int = 512) -> float:
+                      hop_length: int = 512, rms: Optional[np.ndarray] = None) -> float:
         """
         Calculate Signal-to-Noise Ratio (SNR) in dB
         Uses energy-based approach to estimate signal vs noise
         """
-        # Calculate RMS energy per frame
-        rms = librosa.feature.rms(y=y, frame_length=frame_length, 
-                                  hop_length=hop_length)[0]
+        # Calculate RMS energy per frame, unless the caller already has it
+        if rms is None:
+            rms = self.frame_rms(y, frame_length, hop_length)
         
         # Separate signal and noise using percentile threshold
-        threshold = np.percentile(rms, 20)  # Bottom 20% considered noise
+        threshold = self.percentile(rms, 20)  # Bottom 20% considered noise
         
-        noise_frames = rms[rms < threshold]
-        signal_frames = rms[rms >= threshold]
+        # One mask; the signal energy is the total less the noise energy, so
+        # only the (smaller) noise selection is copied out
+        noise_mask = rms < threshold
+        noise_count = int(np.count_nonzero(noise_mask))
+        signal_count = rms.size - noise_count
         
-        if len(noise_frames) == 0 or len(signal_frames) == 0:
+        if noise_count == 0 or signal_count == 0:
             return 30.0  # Default high SNR if can't separate
         
-        signal_power = np.mean(signal_frames ** 2)
-        noise_power = np.mean(noise_frames ** 2)
+        energy = np.square(rms, dtype=np.float64)
+        noise_energy = energy[noise_mask].sum()
+        signal_power = (energy.sum() - noise_energy) / signal_count
+        noise_power = noise_energy / noise_count
         
         if noise_power == 0:
             return 40.0  # Very clean signal
@@ -190,6 +495,18 @@ class AudioAnalyzer:
         snr_db = 10 * np.log10(signal_power / noise_power)
         return float(snr_db)
     
+    @staticmethod
+    def percentile(x: np.ndarray, q: float) -> float:
+        """
+        np.percentile(x, q) with linear interpolation, from a selection of
+        the two neighbouring order statistics rather than a sort of x
+        """
+        pos = (x.size - 1) * q / 100
+        lo = int(pos)
+        hi = min(lo + 1, x.size - 1)
+        below, above = np.partition(x, (lo, hi))[[lo, hi]]
+        return below + (above - below) * (pos - lo)
+    
     def classify_noise_level(self, snr_db: float) -> str:
         """
         Classify noise level based on SNR
@@ -202,22 +519,29 @@ class AudioAnalyzer:
         else:
             return "high_noise"
     
-    def analyze_speech_clarity(self, y: np.ndarray, sr: int) -> Dict[str, float]:
+    def analyze_speech_clarity(self, y: np.ndarray, sr: int,
+                               spectrogram: Optional[Tuple[np.ndarray, np.ndarray]] = None
+                               ) -> Dict[str, float]:
         """
         Analyze speech clarity using multiple acoustic features
+        All spectral features come from one (magnitude, power) spectrogram pair,
+        computed here unless passed in
         """
+        S, power = spectrogram if spectrogram is not None else self.spectrogram(y)
+        
         # Extract features
-        spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=y, sr=sr))
-        spectral_rolloff = np.mean(librosa.feature.spectral_rolloff(y=y, sr=sr))
-        zero_crossing_rate = np.mean(librosa.feature.zero_crossing_rate(y))
+        spectral_centroid = np.mean(librosa.feature.spectral_centroid(S=S, sr=sr))
+        spectral_rolloff = np.mean(librosa.feature.spectral_rolloff(S=S, sr=sr))
+        zero_crossing_rate = self.mean_zero_crossing_rate(y)
         
         # MFCC statistics (useful for clarity)
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+        mel_db = librosa.power_to_db(self.mel_spectrogram(power, sr))
+        mfccs = librosa.feature.mfcc(S=mel_db, n_mfcc=13)
         mfcc_mean = np.mean(mfccs, axis=1)
         mfcc_std = np.mean(np.std(mfccs, axis=1))
         
         # Spectral flatness (indicates noisiness)
-        spectral_flatness = np.mean(librosa.feature.spectral_flatness(y=y))
+        spectral_flatness = np.mean(librosa.feature.spectral_flatness(S=S))
         
         return {
             'spectral_centroid': float(spectral_centroid),
@@ -250,55 +574,200 @@ class AudioAnalyzer:
         """
         # Use librosa's built-in voice activity detection
         intervals = librosa.effects.split(y, top_db=top_db)
-        
+        return self.speech_percentage(intervals, len(y))
+    
+    @staticmethod
+    def speech_percentage(intervals: np.ndarray, n_samples: int) -> float:
+        """Percentage of n_samples covered by speech intervals"""
         if len(intervals) == 0:
             return 0.0
-        
-        speech_duration = sum([end - start for start, end in intervals])
-        total_duration = len(y)
-        
-        speech_percentage = (speech_duration / total_duration) * 100
-        return float(speech_percentage)
+        speech_duration = int((intervals[:, 1] - intervals[:, 0]).sum())
+        return float(speech_duration / n_samples * 100)
     
-    def analyze_speaking_style(self, y: np.ndarray, sr: int) -> Dict[str, any]:
+    def analyze_speaking_style(self, y: np.ndarray, sr: int,
+                               rms: Optional[np.ndarray] = None) -> Dict[str, any]:
         """
         Analyze speaking style characteristics
         Helps distinguish between read, spontaneous, and conversational speech
         """
-        # Detect pauses
-        intervals = librosa.effects.split(y, top_db=30)
-        
-        if len(intervals) < 2:
-            pause_count = 0
-            avg_pause_duration = 0
-        else:
-            pauses = []
-            for i in range(len(intervals) - 1):
-                pause_start = intervals[i][1]
-                pause_end = intervals[i + 1][0]
-                pause_duration = (pause_end - pause_start) / sr
-                if pause_duration > 0.1:  # Minimum 100ms to count as pause
-                    pauses.append(pause_duration)
-            
-            pause_count = len(pauses)
-            avg_pause_duration = np.mean(pauses) if pauses else 0
+        if rms is None:
+            rms = self.frame_rms(y)
         
-        # Speaking rate (syllables per second estimate)
-        speech_segments = [y[start:end] for start, end in intervals]
-        total_speech_duration = sum([len(seg) / sr for seg in speech_segments])
+        # Detect speech once, for both pauses and voice activity. These are
+        # the intervals librosa.effects.split(y, top_db=30) finds, taken from
+        # the frame RMS that is already computed
+        intervals = self.split_intervals(rms, len(y), top_db=30)
+        pause_count, avg_pause_duration = self.pause_stats(intervals, sr)
         
         # Estimate energy variations (more variation = less monotonous)
-        rms = librosa.feature.rms(y=y)[0]
         energy_variation = float(np.std(rms))
         
         return {
             'pause_count': pause_count,
             'avg_pause_duration': float(avg_pause_duration),
-            'speech_percentage': self.detect_voice_activity(y, sr),
+            'speech_percentage': self.speech_percentage(intervals, len(y)),
             'energy_variation': energy_variation,
             'total_duration': float(len(y) / sr)
         }
     
+    def pause_stats(self, intervals: np.ndarray, sr: int) -> Tuple[int, float]:
+        """(count, mean duration in seconds) of the pauses between speech intervals"""
+        if len(intervals) < 2:
+            return 0, 0
+        # Minimum 100ms to count as pause
+        return _pause_stats(np.ascontiguousarray(intervals), sr, 0.1)
+    
+    @staticmethod
+    def split_intervals(rms: np.ndarray, n_samples: int, top_db: int = 30,
+                        hop_length: int = 512) -> np.ndarray:
+        """
+        Non-silent [start, end) sample intervals, computed from frame RMS the
+        way librosa.effects.split computes them from the signal
+        """
+        non_silent = librosa.amplitude_to_db(rms, ref=np.max, top_db=None) > -top_db
+        edges = [np.flatnonzero(np.diff(non_silent.astype(int))) + 1]
+        if non_silent[0]:
+            edges.insert(0, np.array([0]))
+        if non_silent[-1]:
+            edges.append(np.array([len(non_silent)]))
+        edges = librosa.frames_to_samples(np.concatenate(edges), hop_length=hop_length)
+        return np.minimum(edges, n_samples).reshape((-1, 2))
+    
+    def should_stream(self, file_path: str, duration: Optional[float] = None) -> bool:
+        """
+        Whether a file is long enough to be analyzed block by block (see
+        analyze_stream). duration, if the caller already read it from the
+        header, settles short files without reading the header again.
+        """
+        if duration is not None and duration < self.STREAM_MIN_SECONDS:
+            return False
+        try:
+            info = sf.info(file_path)
+        except RuntimeError:
+            return False  # Not readable by soundfile; load it whole
+        return info.frames / info.samplerate >= self.STREAM_MIN_SECONDS
+    
+    def analyze_stream(self, file_path: str, timings: Dict, n_fft: int = 2048,
+                       hop_length: int = 512, block_seconds: int = 30) -> Tuple[int, int, float, Dict, Dict]:
+        """
+        Compute the acoustic features of a long file block by block, so the
+        whole signal and its spectrogram are never in memory at once
+        
+        Frames are aligned exactly as in the whole-signal analysis; blocks
+        overlap by half a frame on each side. The spectral features see the
+        ends zero padded, and the zero-crossing rate sees them edge padded,
+        as in the whole-signal analysis. Per-frame features are summed as
+        they come, and only the frame RMS and mel bands are kept, as MFCCs and
+        pauses need the whole file's maximum. Returns (number of samples,
+        analysis rate, SNR, clarity features, style features).
+        """
+        import soxr
+        
+        info = sf.info(file_path)
+        sr = self.sample_rate
+        if self.feature_rate and self.feature_rate < sr:
+            sr = self.feature_rate
+        resampler = (soxr.ResampleStream(info.samplerate, sr, 1, dtype='float32', quality='HQ')
+                     if info.samplerate != sr else None)
+        
+        pad = n_fft // 2
+        rms_parts, mel_parts = [], []
+        sums = dict.fromkeys(('spectral_centroid', 'spectral_rolloff',
+                              'zero_crossing_rate', 'spectral_flatness'), 0.0)
+        frame_count = 0
+        
+        def analyze_frames(segment: np.ndarray, segment_start: int):
+            """Accumulate the features of every full frame in segment, which starts at sample segment_start"""
+            nonlocal frame_count
+            start = time.perf_counter()
+            rms_parts.append(self.frame_rms(segment, n_fft, hop_length, center=False))
+            timings['snr'] = timings.get('snr', 0) + time.perf_counter() - start
+            
+            start = time.perf_counter()
+            S, power = self.spectrogram_frames(segment, n_fft, hop_length)
+            sums['spectral_centroid'] += librosa.feature.spectral_centroid(S=S, sr=sr).sum()
+            sums['spectral_rolloff'] += librosa.feature.spectral_rolloff(S=S, sr=sr).sum()
+            sums['spectral_flatness'] += librosa.feature.spectral_flatness(S=S).sum()
+            # Edge pad instead of zero pad where the segment runs past either end
+            first = max(0, -segment_start)
+            last = min(len(segment), n_samples - segment_start)
+            if first > 0 or last < len(segment):
+                segment = segment.copy()
+                segment[:first] = segment[first]
+                segment[last:] = segment[last - 1]
+            sums['zero_crossing_rate'] += (
+                self.zero_crossing_counts(segment, n_fft, hop_length).sum() / n_fft)
+            mel_parts.append(self.mel_spectrogram(power, sr))
+            frame_count += S.shape[1]
+            timings['clarity'] = timings.get('clarity', 0) + time.perf_counter() - start
+        
+        # buffer holds samples from buffer_start on; the left edge is zero
+        # padded like a centered STFT
+        buffer = np.zeros(pad, dtype=np.float32)
+        buffer_start = -pad
+        next_center = 0
+        n_samples = 0
+        
+        def take_frames(last_center: int):
+            """Analyze frames centered from next_center up to last_center, then drop used samples"""
+            nonlocal buffer, buffer_start, next_center
+            if last_center < next_center:
+                return
+            analyze_frames(buffer[next_center - pad - buffer_start:last_center + pad - buffer_start],
+                           next_center - pad)
+            next_center = last_center + hop_length
+            drop = next_center - pad - buffer_start
+            buffer, buffer_start = buffer[drop:], buffer_start + drop
+        
+        start = time.perf_counter()
+        for block in sf.blocks(file_path, blocksize=info.samplerate * block_seconds,
+                               dtype='float32', always_2d=True):
+            mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+            if resampler is not None:
+                mono = resampler.resample_chunk(mono)
+            n_samples += len(mono)
+            buffer = np.concatenate([buffer, mono])
+            timings['load_audio'] = timings.get('load_audio', 0) + time.perf_counter() - start
+            # Every frame whose window is already complete
+            end = buffer_start + len(buffer)
+            take_frames((end - pad) // hop_length * hop_length)
+            start = time.perf_counter()
+        
+        if resampler is not None:
+            tail = resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+            n_samples += len(tail)
+            buffer = np.concatenate([buffer, tail])
+        # Zero pad the right edge and take the remaining frames
+        last_center = n_samples // hop_length * hop_length
+        missing = last_center + pad - (buffer_start + len(buffer))
+        if missing > 0:
+            buffer = np.concatenate([buffer, np.zeros(missing, dtype=np.float32)])
+        take_frames(last_center)
+        
+        start = time.perf_counter()
+        rms = np.concatenate(rms_parts)
+        snr_db = self.calculate_snr(None, rms=rms)
+        mfccs = librosa.feature.mfcc(S=librosa.power_to_db(np.concatenate(mel_parts, axis=1)),
+                                     n_mfcc=13)
+        clarity_features = {name: float(total / frame_count) for name, total in sums.items()}
+        clarity_features['mfcc_std'] = float(np.mean(np.std(mfccs, axis=1)))
+        del mel_parts, mfccs
+        timings['clarity'] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        intervals = self.split_intervals(rms, n_samples, top_db=30, hop_length=hop_length)
+        pause_count, avg_pause_duration = self.pause_stats(intervals, sr)
+        style_features = {
+            'pause_count': pause_count,
+            'avg_pause_duration': float(avg_pause_duration),
+            'speech_percentage': self.speech_percentage(intervals, n_samples),
+            'energy_variation': float(np.std(rms)),
+            'total_duration': float(n_samples / sr)
+        }
+        timings['style'] = timings.get('style', 0) + time.perf_counter() - start
+        
+        return n_samples, sr, snr_db, clarity_features, style_features
+    
     def classify_speaking_style(self, style_features: Dict[str, any]) -> str:
         """
         Classify speaking style based on acoustic features
@@ -318,31 +787,338 @@ class AudioAnalyzer:
         
         # Default to spontaneous for ambiguous cases
         return "spontaneous_speech"
+    
+    def analyze_file(self, audio_path: str, timings: Dict, keep_audio: bool = False,
+                     duration: Optional[float] = None) -> Dict:
+        """
+        Load an audio file and compute its acoustic tags, recording stage times
+        in timings. With keep_audio, the loaded signal is returned under 'audio'
+        so it can be transcribed without decoding the file again. duration is
+        the file's header duration, if the caller already read it.
+        """
+        print_detail(f"\n{RULE}")
+        print_detail(f"Processing: {audio_path}")
+        print_detail(f"{RULE}")
+        
+        # Validate file before processing; this is the only stat of the
+        # file, its size is passed on to the loader and the metadata
+        try:
+            stat = Path(audio_path).stat()
+        except FileNotFoundError:
+            print(f"❌ ERROR: File not found: {audio_path}")
+            raise FileNotFoundError(f"File not found: {audio_path}")
+        file_size = stat.st_size
+        file_size_mb = file_size / (1024 * 1024)
+        file_ext = Path(audio_path).suffix.lower()
+        
+        print_progress(f"File info:", 0)
+        print_progress(f"Size: {file_size_mb:.2f} MB", 1)
+        print_progress(f"Format: {file_ext}", 1)
+        
+        # Warn about large files
+        if file_size_mb > 100:
+            print_progress(f"⚠ Large file detected - loading may take longer", 1)
+        
+        # Warn about format
+        if file_ext not in ['.mp3', '.wav', '.flac', '.m4a']:
+            print_progress(f"⚠ Unusual format - may not load correctly", 1)
+        
+        # Long files are analyzed block by block instead of being loaded whole
+        if self.should_stream(audio_path, duration):
+            print_detail()
+            print_progress("⏳ Long file - analyzing in blocks...", 0)
+            n_samples, sr, snr_db, clarity_features, style_features = \
+                self.analyze_stream(audio_path, timings)
+            duration = n_samples / sr
+            loaded, load_sr = None, self.sample_rate
+            print_progress(f"✓ Analyzed {duration:.2f}s audio at {sr} Hz", 1)
+        else:
+            y, sr = self._load_for_analysis(audio_path, timings, stat)
+            duration = len(y) / sr
+            
+            # Analyze audio properties
+            print_progress("⏳ Analyzing acoustic properties...", 0)
+            
+            # Features may be computed on a decimated copy; duration and the
+            # reported sample rate still describe the loaded audio
+            loaded, load_sr = y, sr
+            y, sr = self.feature_signal(y, sr)
+            if sr != load_sr:
+                print_progress(f"Analyzing at {sr} Hz", 1)
+            
+            # Frame energies and the spectrogram are each computed once and
+            # shared by the analyses below
+            # SNR calculation
+            print_progress("Calculating Signal-to-Noise Ratio...", 1)
+            start = time.perf_counter()
+            rms = self.frame_rms(y)
+            snr_db = self.calculate_snr(y, rms=rms)
+            timings['snr'] = time.perf_counter() - start
+            
+            # Speech clarity
+            print_progress("Analyzing speech clarity features...", 1)
+            start = time.perf_counter()
+            spectrogram = self.spectrogram(y)
+            clarity_features = self.analyze_speech_clarity(y, sr, spectrogram)
+            del spectrogram
+            timings['clarity'] = time.perf_counter() - start
+            
+            # Speaking style
+            print_progress("Detecting speaking style patterns...", 1)
+            start = time.perf_counter()
+            style_features = self.analyze_speaking_style(y, sr, rms)
+            timings['style'] = time.perf_counter() - start
+        
+        noise_level = self.classify_noise_level(snr_db)
+        print_progress(f"✓ SNR: {snr_db:.2f} dB → {noise_level} ({timings['snr']:.2f}s)", 2)
+        speech_clarity = self.classify_speech_clarity(clarity_features, snr_db)
+        print_progress(f"✓ Speech Clarity: {speech_clarity} ({timings['clarity']:.2f}s)", 2)
+        speaking_style = self.classify_speaking_style(style_features)
+        print_progress(f"✓ Style: {speaking_style} ({timings['style']:.2f}s)", 2)
+        
+        # Voice activity
+        voice_activity = style_features['speech_percentage']
+        print_progress(f"✓ Voice Activity: {voice_activity:.1f}%", 2)
+        
+        analysis = {
+            'file_size_bytes': file_size,
+            'duration': duration,
+            'sample_rate': load_sr,
+            'snr_db': snr_db,
+            'noise_level': noise_level,
+            'noise_confidence': 'high',
+            'speech_clarity': speech_clarity,
+            'clarity_confidence': 'medium',
+            'speaking_style': speaking_style,
+            'voice_activity': voice_activity,
+            'clarity_features': clarity_features,
+            'style_features': style_features
+        }
+        if keep_audio and loaded is not None:
+            analysis['audio'] = loaded
+        return analysis
+    
+    def _cache_path(self, audio_path: str, stat: os.stat_result) -> Optional[Path]:
+        """Where the decoded signal of this version of the file is cached, if caching is on"""
+        if self.cache_dir is None:
+            return None
+        key = f"{os.path.abspath(audio_path)}:{stat.st_mtime_ns}:{stat.st_size}:{self.sample_rate}"
+        return Path(self.cache_dir) / f"{hashlib.blake2b(key.encode(), digest_size=20).hexdigest()}.npy"
+    
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[np.ndarray]:
+        """The cached signal, memory-mapped read-only, or None if there is none"""
+        if cache_path is None:
+            return None
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached(self, cache_path: Optional[Path], y: np.ndarray):
+        """Cache a decoded signal; a failed write only costs the next run a decode"""
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, y)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print_progress(f"⚠ Could not cache decoded audio: {e}", 1)
+            tmp_path.unlink(missing_ok=True)
+    
+    def _load_for_analysis(self, audio_path: str, timings: Dict,
+                           stat: Optional[os.stat_result] = None) -> Tuple[np.ndarray, int]:
+        """Load a whole file as float32 for analyze_file, reporting progress"""
+        print_detail()
+        print_progress("⏳ Loading audio file...", 0)
+        start = time.perf_counter()
+        cache_path = self._cache_path(audio_path, stat) if stat is not None else None
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            timings['load_audio'] = time.perf_counter() - start
+            print_progress(f"✓ Reused {len(cached) / self.sample_rate:.2f}s of decoded audio "
+                           f"from the cache", 1)
+            return cached, self.sample_rate
+        try:
+            y, sr = self.load_audio(audio_path, stat.st_size if stat is not None else None)
+            # Keep the signal, and so every spectrogram made from it, in float32
+            y = y.astype(np.float32, copy=False)
+            self._store_cached(cache_path, y)
+            timings['load_audio'] = time.perf_counter() - start
+            print_progress(f"✓ Loaded {len(y) / sr:.2f}s audio in {timings['load_audio']:.2f}s", 1)
+            return y, sr
+        except Exception as e:
+            print()
+            print(f"❌ FAILED TO LOAD AUDIO FILE")
+            print(f"   File: {audio_path}")
+            print(f"   Error: {str(e)}")
+            raise
+
+
+COMPUTE_TYPES = ['auto', 'int8', 'int8_float16', 'int8_float32', 'float16', 'float32']
+
+# Whisper takes in-memory audio as 16 kHz mono float32
+WHISPER_SAMPLE_RATE = 16000
+
+# Where --audio-cache keeps decoded signals when no directory is given
+DEFAULT_AUDIO_CACHE = Path.home() / ".cache" / "thai_stt"
+
+
+def resolve_compute_type(compute_type: str, backend: str, device: str) -> str:
+    """
+    The compute type to load Whisper with; this is the one place 'auto' is
+    resolved, for the command line and the launcher alike
+    """
+    if backend == "faster-whisper":
+        if compute_type == "auto":
+            return "int8_float16" if device == "cuda" else "int8"
+        return compute_type
+    if compute_type == "auto":
+        return "float16" if device == "cuda" else "float32"
+    if compute_type.startswith("int8"):
+        print(f"Note: {compute_type} needs faster-whisper; using float32 instead")
+        return "float32"
+    return compute_type
+
+
+def detect_device() -> str:
+    """Return 'cuda' if a CUDA device is usable for transcription, else 'cpu'"""
+    if FASTER_WHISPER_AVAILABLE:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if OPENAI_WHISPER_AVAILABLE:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return "cpu"
+
+
+@functools.lru_cache(maxsize=1)
+def check_ffmpeg() -> bool:
+    """
+    Check if FFmpeg is installed
+    
+    The result is cached, so the lookup (and its message) happens once per
+    process however many taggers are created.
+    """
+    import subprocess
+    
+    # Check using shutil.which (more reliable)
+    ffmpeg_path = find_ffmpeg()
+    if ffmpeg_path:
+        print_progress(f"✓ FFmpeg found: {ffmpeg_path}", 1)
+        return True
+    
+    # Fallback: try running ffmpeg
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            print_progress("✓ FFmpeg is available", 1)
+            return True
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    
+    # FFmpeg not found
+    print_progress("⚠ FFmpeg not found - MP3 support may be limited", 1)
+    print_progress("  Install: https://ffmpeg.org/download.html", 1)
+    print_progress("  Ubuntu/Debian: sudo apt-get install ffmpeg", 1)
+    print_progress("  macOS: brew install ffmpeg", 1)
+    print_progress("  Windows: Download from ffmpeg.org", 1)
+    return False
+
+
+# Loaded Whisper models by (backend, model name, device, compute type), so a
+# process that builds several taggers (notebooks, the server, repeated
+# process_* calls) loads each model once
+_WHISPER_MODELS: Dict[Tuple[str, str, str, str], object] = {}
+
+
+def load_whisper_model(backend: str, model_name: str, device: str, compute_type: str):
+    """Return the Whisper model for these settings, loading it on first use"""
+    key = (backend, model_name, device, compute_type)
+    model = _WHISPER_MODELS.get(key)
+    if model is None:
+        if backend == "faster-whisper":
+            model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        else:
+            model = whisper.load_model(model_name, device=device)
+        _WHISPER_MODELS[key] = model
+    return model
 
 
 class SpeechTranscriber:
-    """Handles speech transcription using Whisper"""
+    """
+    Handles speech transcription using Whisper
+    
+    Uses the CTranslate2 backend from faster-whisper whenever it is
+    installed: it is faster at every precision and the only one with the
+    quantized (int8*) compute types. Otherwise openai-whisper is used.
+    """
     
-    def __init__(self, model_name: str = "medium"):
+    def __init__(self, model_name: str = "medium", compute_type: str = "auto",
+                 vad_filter: bool = False):
+        self.backend = None
+        self.device = None
+        # Silero VAD in faster-whisper drops what it classifies as non-speech,
+        # so transcripts differ from openai-whisper's; only used when asked for
+        self.vad_filter = vad_filter
         if not WHISPER_AVAILABLE:
             self.model = None
             return
         
-        print(f"Loading Whisper model: {model_name}...")
-        self.model = whisper.load_model(model_name)
+        device = detect_device()
+        self.device = device
+        self.backend = "faster-whisper" if FASTER_WHISPER_AVAILABLE else "openai-whisper"
+        compute_type = resolve_compute_type(compute_type, self.backend, device)
+        self.compute_type = compute_type
+        
+        if (self.backend, model_name, device, compute_type) in _WHISPER_MODELS:
+            print(f"Reusing loaded Whisper model: {model_name} ({self.backend}, {device}, {compute_type})")
+        else:
+            print(f"Loading Whisper model: {model_name} ({self.backend}, {device}, {compute_type})...")
+        self.model = load_whisper_model(self.backend, model_name, device, compute_type)
         print("Model loaded successfully!")
     
-    def transcribe(self, audio_path: str) -> Optional[Dict[str, any]]:
-        """Transcribe audio file to text"""
+    def transcribe(self, audio: Union[str, np.ndarray]) -> Optional[Dict[str, any]]:
+        """
+        Transcribe audio to text
+        audio is a file path, or an already loaded 16 kHz mono signal, which
+        saves Whisper from decoding the file again
+        """
         if not WHISPER_AVAILABLE or self.model is None:
             return None
         
+        if isinstance(audio, np.ndarray):
+            # Cached signals are read-only memory maps; torch needs a writable array
+            audio = np.require(audio, np.float32, "W")
+        
         try:
+            if self.backend == "faster-whisper":
+                segments, info = self.model.transcribe(
+                    audio,
+                    language="th",  # Thai language
+                    task="transcribe",
+                    vad_filter=self.vad_filter
+                )
+                segments = [{'start': seg.start, 'end': seg.end, 'text': seg.text}
+                            for seg in segments]
+                return {
+                    'text': "".join(seg['text'] for seg in segments).strip(),
+                    'language': info.language or 'th',
+                    'segments': segments
+                }
+            
             result = self.model.transcribe(
-                audio_path,
+                audio,
                 language="th",  # Thai language
                 task="transcribe",
-                fp16=False  # Set to True if using GPU
+                fp16=self.compute_type == "float16"
             )
             
             return {
@@ -353,15 +1129,146 @@ class SpeechTranscriber:
         except Exception as e:
             print(f"Transcription error: {e}")
             return None
+    
+    def transcribe_batch(self, audio_paths: List[str],
+                         audios: Optional[List[Optional[np.ndarray]]] = None
+                         ) -> List[Optional[Dict[str, any]]]:
+        """
+        Transcribe several files at once
+        
+        Clips that fit in a single 30-second Whisper window are decoded together
+        as one batch of mel spectrograms; longer clips go through the regular
+        long-form transcribe() one by one. audios optionally holds each file's
+        already loaded 16 kHz signal (or None to read the file).
+        """
+        if not WHISPER_AVAILABLE or self.model is None:
+            return [None] * len(audio_paths)
+        
+        if audios is None:
+            audios = [None] * len(audio_paths)
+        inputs = [os.fspath(audio_path) if audio is None else audio
+                  for audio_path, audio in zip(audio_paths, audios)]
+        
+        if self.backend == "faster-whisper":
+            # CTranslate2 batches within a file, not across files
+            return [self.transcribe(audio) for audio in inputs]
+        
+        import torch
+        
+        results: List[Optional[Dict[str, any]]] = [None] * len(audio_paths)
+        short_idx = []
+        mels = []
+        n_mels = getattr(self.model.dims, 'n_mels', 80)
+        mel_kwargs = {'n_mels': n_mels} if n_mels != 80 else {}
+        
+        for i, audio in enumerate(inputs):
+            try:
+                if isinstance(audio, (str, os.PathLike)):
+                    audio = whisper.load_audio(os.fspath(audio))
+                audio = np.require(audio, np.float32, "W")
+            except Exception as e:
+                print(f"Transcription error: {e}")
+                continue
+            if len(audio) > whisper.audio.N_SAMPLES:
+                results[i] = self.transcribe(audio)
+                continue
+            short_idx.append(i)
+            mels.append(whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), **mel_kwargs))
+        
+        if mels:
+            try:
+                batch = torch.stack(mels).to(self.model.device)
+                options = whisper.DecodingOptions(language="th", task="transcribe",
+                                                  fp16=self.compute_type == "float16")
+                for i, decoded in zip(short_idx, whisper.decode(self.model, batch, options)):
+                    results[i] = {
+                        'text': decoded.text.strip(),
+                        'language': decoded.language or 'th',
+                        'segments': []
+                    }
+            except Exception as e:
+                print(f"Batched transcription error: {e}")
+                for i in short_idx:
+                    results[i] = self.transcribe(inputs[i])
+        
+        return results
 
 
 class LanguageAnalyzer:
     """Analyzes transcribed text for linguistic features"""
     
+    # Domain-specific keywords (partial lists for demonstration)
+    VOCAB_KEYWORDS = {
+        'business': [
+            'roi', 'stakeholder', 'revenue', 'profit', 'ผลกำไร', 'รายได้',
+            'ธุรกิจ', 'การตลาด', 'ลงทุน', 'หุ้น', 'บริษัท', 'กำไร'
+        ],
+        'medical': [
+            'patient', 'doctor', 'hospital', 'ผู้ป่วย', 'แพทย์', 'โรงพยาบาล',
+            'อาการ', 'การรักษา', 'โรค', 'ยา', 'การวินิจฉัย', 'myocardial'
+        ],
+        'technical': [
+            'database', 'server', 'code', 'algorithm', 'deploy', 'api',
+            'โปรแกรม', 'ระบบ', 'เซิร์ฟเวอร์', 'คอมพิวเตอร์', 'software', 'hardware'
+        ],
+    }
+    
     def __init__(self):
         self.thai_available = PYTHAINLP_AVAILABLE
+        
+        # With pyahocorasick, one automaton finds the keywords of every
+        # domain in a single pass over the text
+        self._keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for domain, keywords in self.VOCAB_KEYWORDS.items():
+                for kw in keywords:
+                    automaton.add_word(kw, (domain, kw))
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+    
+    def _keyword_counts(self, text_lower: str) -> Dict[str, int]:
+        """Number of distinct keywords of each domain that occur in text_lower"""
+        if self._keyword_automaton is None:
+            return {domain: sum(1 for kw in keywords if kw in text_lower)
+                    for domain, keywords in self.VOCAB_KEYWORDS.items()}
+        
+        counts = dict.fromkeys(self.VOCAB_KEYWORDS, 0)
+        for domain, _ in {match for _, match in self._keyword_automaton.iter(text_lower)}:
+            counts[domain] += 1
+        return counts
     
-    def detect_code_switching(self, text: str) -> str:
+    @staticmethod
+    def _codepoints(text: str) -> np.ndarray:
+        """The code points of text as a uint32 array"""
+        return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    
+    def analyze_text(self, text: str) -> Tuple[str, str, str]:
+        """
+        (code switching, vocabulary type, normalized text) of text from one
+        scan of its code points
+        
+        Lower-casing only changes cased letters, and Thai has none, so the
+        lower-case copy is skipped when the text holds nothing but Thai and
+        ASCII characters other than A-Z. Text without any Thai characters skips
+        the Thai-specific passes of PyThaiNLP's normalizer.
+        """
+        if not text:
+            return "no_code_switching", "general_vocab", text
+        
+        codepoints = self._codepoints(text)
+        thai = (codepoints >= 0x0E00) & (codepoints <= 0x0E7F)
+        needs_lower = bool(np.any(((codepoints >= 0x41) & (codepoints <= 0x5A))
+                                  | ((codepoints > 0x7F) & ~thai)))
+        text_lower = text.lower() if needs_lower else text
+        code_switching = self.detect_code_switching(text, codepoints, thai)
+        vocabulary_type = self.analyze_vocabulary_type(text, text_lower)
+        normalized_text = self.normalize_text(text, has_thai=bool(thai.any()))
+        return code_switching, vocabulary_type, normalized_text
+    
+    def detect_code_switching(self, text: str,
+                              codepoints: Optional[np.ndarray] = None,
+                              thai: Optional[np.ndarray] = None) -> str:
         """
         Detect code-switching (binary: yes or no)
         Returns 'code_switching' if ANY non-Thai words detected, otherwise 'no_code_switching'
@@ -369,9 +1276,15 @@ class LanguageAnalyzer:
         if not text:
             return "no_code_switching"
         
-        # Count Thai characters vs Latin characters
-        thai_chars = sum(1 for c in text if '\u0E00' <= c <= '\u0E7F')
-        latin_chars = sum(1 for c in text if ('a' <= c.lower() <= 'z'))
+        # Count Thai characters vs Latin characters, on the code points as an
+        # array rather than one character at a time
+        if codepoints is None:
+            codepoints = self._codepoints(text)
+        if thai is None:
+            thai = (codepoints >= 0x0E00) & (codepoints <= 0x0E7F)
+        thai_chars = int(np.count_nonzero(thai))
+        folded = codepoints | 0x20  # ASCII upper case to lower case
+        latin_chars = int(np.count_nonzero((folded >= 0x61) & (folded <= 0x7A)))
         total_alpha = thai_chars + latin_chars
         
         if total_alpha == 0:
@@ -386,7 +1299,7 @@ class LanguageAnalyzer:
         else:
             return "code_switching"
     
-    def analyze_vocabulary_type(self, text: str) -> str:
+    def analyze_vocabulary_type(self, text: str, text_lower: Optional[str] = None) -> str:
         """
         Analyze vocabulary type based on keywords
         This is a basic implementation - can be enhanced with domain-specific lexicons
@@ -394,28 +1307,14 @@ class LanguageAnalyzer:
         if not text:
             return "general_vocab"
         
-        text_lower = text.lower()
-        
-        # Define domain-specific keywords (partial lists for demonstration)
-        business_keywords = [
-            'roi', 'stakeholder', 'revenue', 'profit', 'ผลกำไร', 'รายได้',
-            'ธุรกิจ', 'การตลาด', 'ลงทุน', 'หุ้น', 'บริษัท', 'กำไร'
-        ]
-        
-        medical_keywords = [
-            'patient', 'doctor', 'hospital', 'ผู้ป่วย', 'แพทย์', 'โรงพยาบาล',
-            'อาการ', 'การรักษา', 'โรค', 'ยา', 'การวินิจฉัย', 'myocardial'
-        ]
-        
-        technical_keywords = [
-            'database', 'server', 'code', 'algorithm', 'deploy', 'api',
-            'โปรแกรม', 'ระบบ', 'เซิร์ฟเวอร์', 'คอมพิวเตอร์', 'software', 'hardware'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Count domain-specific keywords
-        business_count = sum(1 for kw in business_keywords if kw in text_lower)
-        medical_count = sum(1 for kw in medical_keywords if kw in text_lower)
-        technical_count = sum(1 for kw in technical_keywords if kw in text_lower)
+        counts = self._keyword_counts(text_lower)
+        business_count = counts['business']
+        medical_count = counts['medical']
+        technical_count = counts['technical']
         
         max_count = max(business_count, medical_count, technical_count)
         
@@ -439,14 +1338,20 @@ class LanguageAnalyzer:
         
         return "general_vocab"
     
-    def normalize_text(self, text: str) -> str:
+    def normalize_text(self, text: str, has_thai: bool = True) -> str:
         """
         Apply basic Thai text normalization
+        
+        has_thai=False says text contains no Thai characters, which leaves
+        only the zero-width and duplicate-space rules with anything to do
         """
         if not self.thai_available or not text:
             return text
         
         try:
+            if not has_thai:
+                return remove_dup_spaces(remove_zw(text))
+            
             # Apply PyThaiNLP normalization
             normalized = normalize(text)
             return normalized
@@ -465,15 +1370,18 @@ class MetadataGenerator:
     def generate_metadata(self, audio_path: str, 
                          audio_analysis: Dict,
                          transcription: Optional[Dict],
-                         language_analysis: Optional[Dict]) -> Dict:
+                         language_analysis: Optional[Dict],
+                         file_size: Optional[int] = None) -> Dict:
         """Generate complete metadata structure"""
+        if file_size is None:
+            file_size = os.path.getsize(audio_path)
         
         metadata = {
             'file_info': {
                 'filename': Path(audio_path).name,
                 'file_path': str(audio_path),
                 'processed_at': datetime.now().isoformat(),
-                'file_size_bytes': os.path.getsize(audio_path)
+                'file_size_bytes': file_size
             },
             'audio_properties': {
                 'duration_seconds': audio_analysis.get('duration', 0),
@@ -528,32 +1436,65 @@ class MetadataGenerator:
         
         return metadata
     
+    def metadata_path(self, audio_filename: str) -> Path:
+        """Path of the metadata file for an audio file"""
+        return self.output_dir / f"{Path(audio_filename).stem}_metadata.json"
+    
     def save_metadata(self, metadata: Dict, audio_filename: str) -> str:
         """Save metadata to JSON file"""
-        base_name = Path(audio_filename).stem
-        output_path = self.output_dir / f"{base_name}_metadata.json"
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        output_path = self.metadata_path(audio_filename)
+        
+        # orjson encodes straight to UTF-8 bytes, and numpy scalars among the
+        # acoustic features as plain numbers
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(
+                metadata,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
         
         return str(output_path)
+    
+    def save_errors(self, errors: List[Dict]) -> str:
+        """
+        Append error records to errors.jsonl in the output directory, one
+        JSON object per line. Appending in a single write keeps the records
+        of launcher workers that share the directory apart.
+        """
+        output_path = self.output_dir / "errors.jsonl"
+        lines = "".join(json.dumps(error, ensure_ascii=False) + "\n" for error in errors)
+        with open(output_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+        return str(output_path)
 
 
 class ThaiSTTAutoTagger:
     """Main class orchestrating the auto-tagging process"""
     
-    def __init__(self, whisper_model: str = "medium", sample_rate: int = 16000):
+    def __init__(self, whisper_model: str = "medium", sample_rate: int = 16000,
+                 compute_type: str = "auto", feature_rate: Optional[int] = None,
+                 audio_cache_dir: Optional[str] = None, vad_filter: bool = False,
+                 enable_transcription: bool = True):
         print_progress("Initializing Thai STT Auto-Tagger...", 0)
         
         # Check FFmpeg availability for MP3 support
         self._check_ffmpeg()
         
-        self.audio_analyzer = AudioAnalyzer(sample_rate=sample_rate)
+        self.audio_analyzer = AudioAnalyzer(sample_rate=sample_rate, feature_rate=feature_rate,
+                                            cache_dir=audio_cache_dir)
         print_progress("✓ Audio analyzer ready", 1)
         
-        self.transcriber = SpeechTranscriber(model_name=whisper_model)
-        if WHISPER_AVAILABLE:
-            print_progress("✓ Transcriber ready", 1)
+        # Without transcription no Whisper model is loaded, and the tagger
+        # can only be used for runs without transcription
+        self.transcriber: Optional[SpeechTranscriber] = None
+        if enable_transcription:
+            self.transcriber = SpeechTranscriber(model_name=whisper_model,
+                                                 compute_type=compute_type,
+                                                 vad_filter=vad_filter)
+            if WHISPER_AVAILABLE:
+                print_progress("✓ Transcriber ready", 1)
         
         self.language_analyzer = LanguageAnalyzer()
         if PYTHAINLP_AVAILABLE:
@@ -563,233 +1504,444 @@ class ThaiSTTAutoTagger:
             
         self.metadata_generator = MetadataGenerator()
         print_progress("✓ Metadata generator ready", 1)
-        print()
-    
-    def _check_ffmpeg(self):
-        """Check if FFmpeg is installed"""
-        import subprocess
-        import shutil
+        print_detail()
         
-        # Check using shutil.which (more reliable)
-        ffmpeg_path = shutil.which('ffmpeg')
-        if ffmpeg_path:
-            print_progress(f"✓ FFmpeg found: {ffmpeg_path}", 1)
-            return True
+        # Set while a multi-file run writes metadata on a background thread
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Tuple[str, Future]] = []
         
-        # Fallback: try running ffmpeg
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                print_progress("✓ FFmpeg is available", 1)
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        # Header durations read by the current directory run, by path
+        self._durations: Dict[str, float] = {}
+        
+        # One row of TIMING_STAGES times per finished file (NaN for stages
+        # the file skipped), for the statistics of a directory run
+        self._stage_times: List[List[float]] = []
+        
+        # Files that failed since the last _save_errors(), with tracebacks
+        self._errors: List[Dict] = []
+    
+    def stage_statistics(self) -> Dict[str, Tuple[float, float]]:
+        """(median, 95th percentile) seconds of each stage over the files timed so far"""
+        if not self._stage_times:
+            return {}
+        times = np.array(self._stage_times)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN stages
+            p50, p95 = np.nanpercentile(times, [50, 95], axis=0)
+        return {stage: (p50[i], p95[i]) for i, stage in enumerate(TIMING_STAGES)
+                if not np.isnan(p50[i])}
+    
+    def _record_error(self, audio_path: str, error: Exception, stage: str = "process"):
+        """
+        Report a failed file, from inside the except block handling error
         
-        # FFmpeg not found
-        print_progress("⚠ FFmpeg not found - MP3 support may be limited", 1)
-        print_progress("  Install: https://ffmpeg.org/download.html", 1)
-        print_progress("  Ubuntu/Debian: sudo apt-get install ffmpeg", 1)
-        print_progress("  macOS: brew install ffmpeg", 1)
-        print_progress("  Windows: Download from ffmpeg.org", 1)
-        return False
+        The console gets one line per failure (plus the traceback in verbose
+        mode); the traceback is kept for errors.jsonl.
+        """
+        name = Path(audio_path).name
+        details = traceback.format_exc()
+        action = "saving metadata for" if stage == "save" else "processing"
+        print(f"\n❌ ERROR {action} {name}")
+        print(f"   Error: {str(error)}")
+        if VERBOSITY == VERBOSE:
+            print(details, end="")
+        self._errors.append({
+            'file': name,
+            'stage': stage,
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'traceback': details,
+            'time': datetime.now().isoformat(),
+        })
+    
+    def _save_errors(self):
+        """Append the recorded errors to errors.jsonl, if there are any"""
+        if not self._errors:
+            return
+        errors, self._errors = self._errors, []
+        try:
+            output_path = self.metadata_generator.save_errors(errors)
+        except OSError as e:
+            print(f"⚠ Could not write error log: {e}")
+            return
+        print(f"Error details:    {output_path}")
+    
+    def _start_background_writes(self):
+        """Write metadata files on a background thread until _finish_background_writes()"""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1,
+                                                   thread_name_prefix="metadata-writer")
+    
+    def _finish_background_writes(self) -> int:
+        """Wait for the queued metadata writes, returning how many failed"""
+        executor, self._io_executor = self._io_executor, None
+        if executor is None:
+            return 0
+        failed = 0
+        for audio_path, future in self._pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                self._record_error(audio_path, e, "save")
+        self._pending_writes = []
+        executor.shutdown()
+        return failed
+    
+    def _check_ffmpeg(self):
+        """Check if FFmpeg is installed (reported once per process)"""
+        return check_ffmpeg()
     
     def process_file(self, audio_path: str, enable_transcription: bool = True) -> Dict:
         """Process a single audio file"""
-        total_start = time.time()
+        total_start = time.perf_counter()
+        timings = {}
         
-        print(f"\n{'='*70}")
-        print(f"Processing: {audio_path}")
-        print(f"{'='*70}")
+        audio_analysis = self._analyze_audio(audio_path, timings,
+                                             keep_audio=enable_transcription)
+        return self._complete_file(audio_path, audio_analysis, timings, total_start,
+                                   enable_transcription)
+    
+    def _complete_file(self, audio_path: str, audio_analysis: Dict, timings: Dict,
+                       total_start: float, enable_transcription: bool) -> Dict:
+        """Transcribe an analyzed file (if enabled) and write its metadata"""
+        audio = self._take_audio(audio_analysis)
         
-        # Validate file before processing
-        if not Path(audio_path).exists():
-            print(f"❌ ERROR: File not found: {audio_path}")
-            raise FileNotFoundError(f"File not found: {audio_path}")
+        # Transcribe
+        transcription = None
+        language_analysis = None
         
-        file_size = Path(audio_path).stat().st_size
-        file_size_mb = file_size / (1024 * 1024)
-        file_ext = Path(audio_path).suffix.lower()
+        if enable_transcription and WHISPER_AVAILABLE:
+            print_progress("⏳ Transcribing audio (this may take a while)...", 0)
+            start = time.perf_counter()
+            transcription = self.transcriber.transcribe(audio if audio is not None else audio_path)
+            timings['transcription'] = time.perf_counter() - start
+            language_analysis = self._analyze_language(transcription, timings)
+        elif not enable_transcription:
+            print_progress("⊘ Transcription disabled (skipped)", 0)
+        else:
+            print_progress("⊘ Transcription unavailable (Whisper not installed)", 0)
         
-        print_progress(f"File info:", 0)
-        print_progress(f"Size: {file_size_mb:.2f} MB", 1)
-        print_progress(f"Format: {file_ext}", 1)
+        return self._finalize(audio_path, audio_analysis, transcription,
+                              language_analysis, timings, total_start)
+    
+    def _analysis_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Pool of audio analysis processes
         
-        # Warn about large files
-        if file_size_mb > 100:
-            print_progress(f"⚠ Large file detected - loading may take longer", 1)
+        NumPy's BLAS and librosa's native code size their thread pools to
+        every core in each process, so each worker is limited to its share
+        of the cores rather than all of them competing for each one.
+        """
+        analyzer = self.audio_analyzer
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                                   initargs=(analyzer.sample_rate, analyzer.feature_rate,
+                                             VERBOSITY, analyzer.cache_dir, threads))
+    
+    def process_parallel(self, audio_paths: List[str], enable_transcription: bool = True,
+                         workers: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """
+        Process files with the audio analysis spread over worker processes
+        
+        Transcription stays in this process, so there is still one Whisper
+        model, and while one file is transcribed the workers analyze the next.
+        With transcription the workers return the decoded signal, so Whisper
+        doesn't decode the file again; at most two files per worker are in
+        flight, which bounds the signals held in memory.
+        Returns (results, number of failed files).
+        """
+        workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        results = []
+        failed = 0
+        keep_audio = enable_transcription and WHISPER_AVAILABLE
         
-        # Warn about format
-        if file_ext not in ['.mp3', '.wav', '.flac', '.m4a']:
-            print_progress(f"⚠ Unusual format - may not load correctly", 1)
+        with self._analysis_pool(workers) as pool:
+            def submit(path):
+                return pool.submit(_analyze_in_worker, path, keep_audio,
+                                   self._durations.get(path))
+            
+            in_flight = 2 * workers
+            futures = deque(submit(path) for path in audio_paths[:in_flight])
+            for i, audio_path in enumerate(audio_paths, 1):
+                future = futures.popleft()
+                if i + in_flight <= len(audio_paths):
+                    futures.append(submit(audio_paths[i + in_flight - 1]))
+                try:
+                    audio_analysis, timings = future.result()
+                    print_detail(f"\n{BAR}")
+                    print_detail(f"📄 FILE {i}/{len(audio_paths)}: {audio_path}")
+                    print_detail(f"{BAR}")
+                    # Count the worker's analysis time towards the file's total
+                    total_start = time.perf_counter() - sum(timings.values())
+                    results.append(self._complete_file(audio_path, audio_analysis, timings,
+                                                       total_start, enable_transcription))
+                except Exception as e:
+                    failed += 1
+                    self._record_error(audio_path, e)
+        
+        return results, failed
+    
+    def process_overlapped(self, audio_paths: List[str]) -> Tuple[List[Dict], int]:
+        """
+        Process and transcribe files one at a time, transcribing each on a
+        background thread while the next one is loaded and analyzed
+        
+        Whisper releases the GIL while it computes, so this overlaps the two
+        stages without a second process or a second copy of the model. At
+        most one file waits for transcription. Only the Whisper call runs on
+        the background thread; the rest of each file, including its output
+        and metadata, is finished on this one. Returns (results, number of
+        failed files).
+        """
+        results = []
+        failed = 0
         
-        timings = {}
+        def transcribe(audio: Union[str, np.ndarray]) -> Tuple[Optional[Dict], float]:
+            start = time.perf_counter()
+            return self.transcriber.transcribe(audio), time.perf_counter() - start
         
-        # Load audio
-        print()
-        print_progress("⏳ Loading audio file...", 0)
-        start = time.time()
+        def collect(audio_path: str, audio_analysis: Dict, timings: Dict,
+                    total_start: float, future: Future):
+            nonlocal failed
+            try:
+                transcription, timings['transcription'] = future.result()
+                print_detail(f"\n{THIN_RULE}")
+                print_detail(f"Finishing: {audio_path}")
+                language_analysis = self._analyze_language(transcription, timings)
+                results.append(self._finalize(audio_path, audio_analysis, transcription,
+                                              language_analysis, timings, total_start))
+            except Exception as e:
+                failed += 1
+                self._record_error(audio_path, e)
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcriber") as pool:
+            pending = None
+            for i, audio_path in enumerate(audio_paths, 1):
+                print_detail(f"\n{BAR}")
+                print_detail(f"📄 FILE {i}/{len(audio_paths)}")
+                print_detail(f"{BAR}")
+                
+                total_start = time.perf_counter()
+                timings = {}
+                try:
+                    audio_analysis = self._analyze_audio(audio_path, timings, keep_audio=True)
+                except Exception as e:
+                    failed += 1
+                    self._record_error(audio_path, e)
+                    continue
+                
+                if pending is not None:
+                    collect(*pending)
+                print_progress("⏳ Transcribing audio in the background...", 0)
+                audio = self._take_audio(audio_analysis)
+                future = pool.submit(transcribe, audio if audio is not None else audio_path)
+                pending = (audio_path, audio_analysis, timings, total_start, future)
+            if pending is not None:
+                collect(*pending)
+        
+        return results, failed
+    
+    def process_batch(self, audio_paths: List[str],
+                      analyzed: Optional[List[Tuple[Dict, Dict]]] = None
+                      ) -> Tuple[List[Dict], int]:
+        """
+        Process files as one group, transcribing them in a single batched
+        Whisper call instead of one call per file
+        
+        analyzed optionally holds each file's (audio analysis, timings) from
+        analyze_file(keep_audio=True) run elsewhere, e.g. in a worker process.
+        A file that fails is recorded and left out; the rest of the group
+        carries on. Returns (results, number of failed files).
+        """
+        total_start = time.perf_counter()
+        failed = 0
+        
+        if analyzed is None:
+            paths = []
+            analyses = []
+            timings_list = []
+            for audio_path in audio_paths:
+                timings = {}
+                try:
+                    analyses.append(self._analyze_audio(audio_path, timings, keep_audio=True))
+                except Exception as e:
+                    failed += 1
+                    self._record_error(audio_path, e)
+                    continue
+                paths.append(audio_path)
+                timings_list.append(timings)
+        else:
+            paths = list(audio_paths)
+            analyses = [audio_analysis for audio_analysis, _ in analyzed]
+            timings_list = [timings for _, timings in analyzed]
+        if not paths:
+            return [], failed
+        if analyzed is not None:
+            # Count the workers' analysis time towards the totals
+            total_start -= max(sum(timings.values()) for timings in timings_list)
+        
+        print_progress(f"⏳ Transcribing {len(paths)} files as one batch...", 0)
+        start = time.perf_counter()
         try:
-            y, sr = self.audio_analyzer.load_audio(audio_path)
-            duration = len(y) / sr
-            timings['load_audio'] = time.time() - start
-            print_progress(f"✓ Loaded {duration:.2f}s audio in {timings['load_audio']:.2f}s", 1)
+            transcriptions = self.transcriber.transcribe_batch(
+                paths, [self._take_audio(analysis) for analysis in analyses])
         except Exception as e:
-            print()
-            print(f"❌ FAILED TO LOAD AUDIO FILE")
-            print(f"   File: {audio_path}")
-            print(f"   Error: {str(e)}")
-            raise
-        
-        # Analyze audio properties
-        print_progress("⏳ Analyzing acoustic properties...", 0)
+            # None of the group was finished, so each file is reported once
+            for audio_path in paths:
+                self._record_error(audio_path, e)
+            return [], failed + len(paths)
+        per_file = (time.perf_counter() - start) / len(paths)
+        print_progress(f"✓ Batch transcribed in {time.perf_counter() - start:.2f}s", 1)
         
-        # SNR calculation
-        print_progress("Calculating Signal-to-Noise Ratio...", 1)
-        start = time.time()
-        snr_db = self.audio_analyzer.calculate_snr(y)
-        noise_level = self.audio_analyzer.classify_noise_level(snr_db)
-        timings['snr'] = time.time() - start
-        print_progress(f"✓ SNR: {snr_db:.2f} dB → {noise_level} ({timings['snr']:.2f}s)", 2)
+        results = []
+        for audio_path, audio_analysis, transcription, timings in zip(
+                paths, analyses, transcriptions, timings_list):
+            print_detail(f"\n{THIN_RULE}")
+            print_detail(f"Finishing: {audio_path}")
+            try:
+                timings['transcription'] = per_file
+                language_analysis = self._analyze_language(transcription, timings)
+                results.append(self._finalize(audio_path, audio_analysis, transcription,
+                                              language_analysis, timings, total_start))
+            except Exception as e:
+                failed += 1
+                self._record_error(audio_path, e)
+        return results, failed
+    
+    def _analyze_audio(self, audio_path: str, timings: Dict, keep_audio: bool = False) -> Dict:
+        """Load an audio file and compute its acoustic tags"""
+        return self.audio_analyzer.analyze_file(audio_path, timings, keep_audio,
+                                                self._durations.get(audio_path))
+    
+    @staticmethod
+    def _take_audio(audio_analysis: Dict) -> Optional[np.ndarray]:
+        """
+        Remove the loaded signal from an analysis, returning it if Whisper
+        can use it directly (i.e. it is at Whisper's sample rate)
+        """
+        audio = audio_analysis.pop('audio', None)
+        if audio_analysis['sample_rate'] != WHISPER_SAMPLE_RATE:
+            return None
+        return audio
+
+    def _analyze_language(self, transcription: Optional[Dict], timings: Dict) -> Optional[Dict]:
+        """Run linguistic analysis on a transcription, if there is any text"""
+        if not transcription or not transcription['text']:
+            return None
         
-        # Speech clarity
-        print_progress("Analyzing speech clarity features...", 1)
-        start = time.time()
-        clarity_features = self.audio_analyzer.analyze_speech_clarity(y, sr)
-        speech_clarity = self.audio_analyzer.classify_speech_clarity(clarity_features, snr_db)
-        timings['clarity'] = time.time() - start
-        print_progress(f"✓ Speech Clarity: {speech_clarity} ({timings['clarity']:.2f}s)", 2)
+        text = transcription['text']
+        print_progress(f"✓ Transcribed in {timings['transcription']:.2f}s", 1)
+        print_progress(f"Text preview: {text[:80]}...", 2)
         
-        # Speaking style
-        print_progress("Detecting speaking style patterns...", 1)
-        start = time.time()
-        style_features = self.audio_analyzer.analyze_speaking_style(y, sr)
-        speaking_style = self.audio_analyzer.classify_speaking_style(style_features)
-        timings['style'] = time.time() - start
-        print_progress(f"✓ Style: {speaking_style} ({timings['style']:.2f}s)", 2)
+        # Analyze language
+        print_progress("⏳ Analyzing linguistic features...", 0)
+        start = time.perf_counter()
+        code_switching, vocabulary_type, normalized_text = \
+            self.language_analyzer.analyze_text(text)
+        timings['linguistic'] = time.perf_counter() - start
         
-        # Voice activity
-        voice_activity = style_features['speech_percentage']
-        print_progress(f"✓ Voice Activity: {voice_activity:.1f}%", 2)
+        print_progress(f"✓ Code-Switching: {code_switching}", 1)
+        print_progress(f"✓ Vocabulary: {vocabulary_type}", 1)
+        print_progress(f"✓ Linguistic analysis done ({timings['linguistic']:.2f}s)", 1)
         
-        audio_analysis = {
-            'duration': duration,
-            'sample_rate': sr,
-            'snr_db': snr_db,
-            'noise_level': noise_level,
-            'noise_confidence': 'high',
-            'speech_clarity': speech_clarity,
-            'clarity_confidence': 'medium',
-            'speaking_style': speaking_style,
-            'voice_activity': voice_activity,
-            'clarity_features': clarity_features,
-            'style_features': style_features
+        # Most text is already normalized; only changed text needs notes
+        changed = normalized_text != text
+        return {
+            'code_switching': code_switching,
+            'vocabulary_type': vocabulary_type,
+            'normalized_text': normalized_text,
+            'normalization_applied': changed,
+            'normalization_notes': (self._get_normalization_notes(text, normalized_text)
+                                    if changed else UNCHANGED_NORMALIZATION_NOTE)
         }
-        
-        # Transcribe
-        transcription = None
-        language_analysis = None
-        
-        if enable_transcription and WHISPER_AVAILABLE:
-            print_progress("⏳ Transcribing audio (this may take a while)...", 0)
-            start = time.time()
-            transcription = self.transcriber.transcribe(audio_path)
-            timings['transcription'] = time.time() - start
-            
-            if transcription and transcription['text']:
-                text = transcription['text']
-                print_progress(f"✓ Transcribed in {timings['transcription']:.2f}s", 1)
-                print_progress(f"Text preview: {text[:80]}...", 2)
-                
-                # Analyze language
-                print_progress("⏳ Analyzing linguistic features...", 0)
-                start = time.time()
-                code_switching = self.language_analyzer.detect_code_switching(text)
-                vocabulary_type = self.language_analyzer.analyze_vocabulary_type(text)
-                normalized_text = self.language_analyzer.normalize_text(text)
-                timings['linguistic'] = time.time() - start
-                
-                print_progress(f"✓ Code-Switching: {code_switching}", 1)
-                print_progress(f"✓ Vocabulary: {vocabulary_type}", 1)
-                print_progress(f"✓ Linguistic analysis done ({timings['linguistic']:.2f}s)", 1)
-                
-                language_analysis = {
-                    'code_switching': code_switching,
-                    'vocabulary_type': vocabulary_type,
-                    'normalized_text': normalized_text,
-                    'normalization_applied': normalized_text != text,
-                    'normalization_notes': self._get_normalization_notes(text, normalized_text)
-                }
-        elif not enable_transcription:
-            print_progress("⊘ Transcription disabled (skipped)", 0)
-        else:
-            print_progress("⊘ Transcription unavailable (Whisper not installed)", 0)
-        
+    
+    def _finalize(self, audio_path: str, audio_analysis: Dict,
+                  transcription: Optional[Dict], language_analysis: Optional[Dict],
+                  timings: Dict, total_start: float) -> Dict:
+        """Generate and save metadata, then print the timing summary"""
         # Generate metadata
         print_progress("⏳ Generating metadata...", 0)
-        start = time.time()
+        start = time.perf_counter()
         metadata = self.metadata_generator.generate_metadata(
-            audio_path, audio_analysis, transcription, language_analysis
+            audio_path, audio_analysis, transcription, language_analysis,
+            file_size=audio_analysis.get('file_size_bytes')
         )
-        timings['metadata'] = time.time() - start
+        timings['metadata'] = time.perf_counter() - start
         print_progress(f"✓ Metadata generated ({timings['metadata']:.2f}s)", 1)
         
-        # Save metadata
+        # Save metadata; during multi-file runs the write is queued so the
+        # next file can start while this one is written
         print_progress("⏳ Saving metadata file...", 0)
-        start = time.time()
-        output_path = self.metadata_generator.save_metadata(
-            metadata, Path(audio_path).name
-        )
-        timings['save'] = time.time() - start
+        start = time.perf_counter()
+        if self._io_executor is not None:
+            output_path = self.metadata_generator.metadata_path(audio_path)
+            self._pending_writes.append((audio_path, self._io_executor.submit(
+                self.metadata_generator.save_metadata, metadata, Path(audio_path).name
+            )))
+        else:
+            output_path = self.metadata_generator.save_metadata(
+                metadata, Path(audio_path).name
+            )
+        timings['save'] = time.perf_counter() - start
         print_progress(f"✓ Saved to: {output_path} ({timings['save']:.2f}s)", 1)
         
-        # Summary
-        total_time = time.time() - total_start
-        print(f"\n{'─'*70}")
-        print(f"⏱️  TIMING SUMMARY:")
-        print(f"{'─'*70}")
-        print(f"  Audio Loading:      {timings.get('load_audio', 0):>6.2f}s")
-        print(f"  SNR Analysis:       {timings.get('snr', 0):>6.2f}s")
-        print(f"  Clarity Analysis:   {timings.get('clarity', 0):>6.2f}s")
-        print(f"  Style Detection:    {timings.get('style', 0):>6.2f}s")
+        self._stage_times.append([timings.get(stage, np.nan) for stage in TIMING_STAGES])
+        
+        # Summary: the timing breakdown, or one line per file in quiet mode
+        total_time = time.perf_counter() - total_start
+        if VERBOSITY == QUIET:
+            print(f"✓ {Path(audio_path).name} → {output_path} ({total_time:.2f}s)")
+            return metadata
+        # Built as one string and written at once, so the block is a single
+        # write to the terminal or pipe
+        lines = [
+            f"\n{THIN_RULE}",
+            "⏱️  TIMING SUMMARY:",
+            THIN_RULE,
+            f"  Audio Loading:      {timings.get('load_audio', 0):>6.2f}s",
+            f"  SNR Analysis:       {timings.get('snr', 0):>6.2f}s",
+            f"  Clarity Analysis:   {timings.get('clarity', 0):>6.2f}s",
+            f"  Style Detection:    {timings.get('style', 0):>6.2f}s",
+        ]
         if 'transcription' in timings:
-            print(f"  Transcription:      {timings.get('transcription', 0):>6.2f}s")
-            print(f"  Linguistic Analysis:{timings.get('linguistic', 0):>6.2f}s")
-        print(f"  Metadata Gen/Save:  {timings.get('metadata', 0) + timings.get('save', 0):>6.2f}s")
-        print(f"  {'─'*35}")
-        print(f"  TOTAL TIME:         {total_time:>6.2f}s")
-        print(f"{'─'*70}")
+            lines.append(f"  Transcription:      {timings.get('transcription', 0):>6.2f}s")
+            lines.append(f"  Linguistic Analysis:{timings.get('linguistic', 0):>6.2f}s")
+        lines += [
+            f"  Metadata Gen/Save:  {timings.get('metadata', 0) + timings.get('save', 0):>6.2f}s",
+            f"  {SHORT_RULE}",
+            f"  TOTAL TIME:         {total_time:>6.2f}s",
+            THIN_RULE,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return metadata
     
     def _get_normalization_notes(self, original: str, normalized: str) -> str:
-        """Generate notes about what normalization did"""
-        if original == normalized:
-            return "No changes made - text is already in standard form"
-        
+        """
+        Generate notes about what normalization did to original; callers
+        use UNCHANGED_NORMALIZATION_NOTE when the text did not change
+        """
         notes = []
         
         # Check what changed
         if len(original) != len(normalized):
             notes.append(f"Length changed: {len(original)} → {len(normalized)} characters")
         
-        # Check for common normalizations
-        import re
+        # Check for common normalizations, on the set of distinct characters
+        # from a single pass over the text
+        chars = set(original)
         
-        # Numbers
-        if re.search(r'\d', original) and original != normalized:
+        # Numbers (any Unicode decimal digit, as regex \d)
+        if any(c.isdecimal() for c in chars):
             notes.append("Numbers may have been normalized")
         
         # Whitespace
-        if '  ' in original or '\n' in original or '\t' in original:
+        if '\n' in chars or '\t' in chars or (' ' in chars and '  ' in original):
             notes.append("Whitespace standardized")
         
         # Zero-width characters
-        if '\u200b' in original:
+        if '\u200b' in chars:
             notes.append("Zero-width spaces removed")
         
         if not notes:
@@ -797,63 +1949,349 @@ class ThaiSTTAutoTagger:
         
         return "; ".join(notes)
     
+    def default_workers(self, enable_transcription: bool) -> int:
+        """
+        Number of audio analysis processes to use when none is given
+        
+        Audio-only runs are CPU bound and use all but one core. Whisper on
+        the CPU already keeps every core busy, so it gets no extra workers;
+        on a GPU, two workers keep it supplied with analyzed files.
+        """
+        cores = os.cpu_count() or 1
+        if not enable_transcription or not WHISPER_AVAILABLE:
+            return max(1, cores - 1)
+        if self.transcriber.device == "cuda":
+            return max(1, min(2, cores - 1))
+        return 1
+    
     def process_directory(self, input_dir: str, pattern: str = "*.mp3",
-                         enable_transcription: bool = True) -> List[Dict]:
-        """Process all audio files in a directory"""
+                         enable_transcription: bool = True,
+                         batch_size: int = 1, workers: Optional[int] = None) -> List[Dict]:
+        """
+        Process all audio files in a directory
+        
+        With batch_size > 1 and transcription enabled, files are sorted by
+        duration and transcribed in groups of similar length. In either mode,
+        workers > 1 analyzes the audio in that many processes; by default
+        that is chosen by default_workers().
+        """
+        if workers is None:
+            workers = self.default_workers(enable_transcription)
         input_path = Path(input_dir)
-        audio_files = list(input_path.glob(pattern))
+        audio_files = list(iter_audio_files(input_dir, pattern))
         
         if not audio_files:
             print(f"\n❌ No audio files found matching pattern: {pattern}")
             print(f"   In directory: {input_path.absolute()}")
             return []
         
-        total_start = time.time()
-        print(f"\n{'='*70}")
-        print(f"📁 BATCH PROCESSING")
-        print(f"{'='*70}")
-        print(f"Directory: {input_path.absolute()}")
-        print(f"Pattern:   {pattern}")
-        print(f"Found:     {len(audio_files)} files")
-        print(f"Mode:      {'Full (with transcription)' if enable_transcription else 'Fast (audio only)'}")
-        print(f"{'='*70}\n")
+        total_start = time.perf_counter()
+        self._stage_times = []
+        
+        # Durations come from the file headers, without decoding. Longest
+        # files go first, so parallel workers don't end on one long file
+        durations = self._durations = self._audio_durations(audio_files)
+        audio_files.sort(key=durations.__getitem__, reverse=True)
+        total_audio = sum(durations.values())
+        
+        print_detail(f"\n{RULE}")
+        print_detail(f"📁 BATCH PROCESSING")
+        print_detail(f"{RULE}")
+        print_detail(f"Directory: {input_path.absolute()}")
+        print_detail(f"Pattern:   {pattern}")
+        print_detail(f"Found:     {len(audio_files)} files ({total_audio / 60:.1f} minutes of audio)")
+        print_detail(f"Mode:      {'Full (with transcription)' if enable_transcription else 'Fast (audio only)'}")
+        print_detail(f"Workers:   {workers}")
+        print_detail(f"{RULE}\n")
         
         results = []
         successful = 0
         failed = 0
         
-        for i, audio_file in enumerate(audio_files, 1):
-            print(f"\n{'█'*70}")
-            print(f"📄 FILE {i}/{len(audio_files)}")
-            print(f"{'█'*70}")
-            
-            try:
-                metadata = self.process_file(str(audio_file), enable_transcription)
-                results.append(metadata)
-                successful += 1
-            except Exception as e:
-                failed += 1
-                print(f"\n❌ ERROR processing {audio_file.name}")
-                print(f"   Error: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                print(f"   Continuing with next file...")
+        self._start_background_writes()
+        try:
+            if batch_size > 1 and enable_transcription and WHISPER_AVAILABLE:
+                successful, failed = self._process_in_batches(audio_files, batch_size, results,
+                                                              workers, durations)
+            elif workers > 1 and len(audio_files) > 1:
+                results, failed = self.process_parallel(audio_files, enable_transcription,
+                                                        workers)
+                successful = len(results)
+            elif enable_transcription and WHISPER_AVAILABLE and len(audio_files) > 1:
+                results, failed = self.process_overlapped(audio_files)
+                successful = len(results)
+            else:
+                for i, audio_file in enumerate(audio_files, 1):
+                    print_detail(f"\n{BAR}")
+                    print_detail(f"📄 FILE {i}/{len(audio_files)}")
+                    print_detail(f"{BAR}")
+                
+                    try:
+                        metadata = self.process_file(audio_file, enable_transcription)
+                        results.append(metadata)
+                        successful += 1
+                    except Exception as e:
+                        failed += 1
+                        self._record_error(audio_file, e)
+        finally:
+            write_failed = self._finish_background_writes()
+            self._durations = {}
+        successful -= write_failed
+        failed += write_failed
         
         # Final summary
-        total_time = time.time() - total_start
-        print(f"\n{'='*70}")
+        total_time = time.perf_counter() - total_start
+        print(f"\n{RULE}")
         print(f"✅ BATCH PROCESSING COMPLETE")
-        print(f"{'='*70}")
+        print(f"{RULE}")
         print(f"Total files:      {len(audio_files)}")
         print(f"Successful:       {successful} ✓")
         if failed > 0:
             print(f"Failed:           {failed} ✗")
         print(f"Total time:       {total_time:.2f}s ({total_time/60:.1f} minutes)")
         print(f"Average per file: {total_time/len(audio_files):.2f}s")
+        if total_audio > 0 and total_time > 0:
+            print(f"Speed:            {total_audio / total_time:.1f}x real time "
+                  f"({total_audio / 60:.1f} minutes of audio)")
         print(f"Output directory: metadata/")
-        print(f"{'='*70}\n")
+        if VERBOSITY == VERBOSE and successful > 1:
+            print(f"\n  {'Stage':<20} {'p50':>8} {'p95':>8}")
+            for stage, (p50, p95) in self.stage_statistics().items():
+                print(f"  {TIMING_STAGES[stage]:<20} {p50:>7.2f}s {p95:>7.2f}s")
+        self._save_errors()
+        print(f"{RULE}\n")
         
         return results
+    
+    @staticmethod
+    def _audio_durations(audio_files: List[str]) -> Dict[str, float]:
+        """Duration of each file from its header (0 if it can't be read)"""
+        durations = {}
+        for audio_file in audio_files:
+            try:
+                durations[audio_file] = get_audio_duration(audio_file)
+            except Exception:
+                durations[audio_file] = 0.0
+        return durations
+    
+    @classmethod
+    def _bucket_files_by_duration(cls, audio_files: List[str], batch_size: int,
+                                  durations: Optional[Dict[str, float]] = None
+                                  ) -> List[List[str]]:
+        """
+        Split files into batches of at most batch_size whose durations are
+        within a factor of two of each other
+        
+        Durations come from the file headers (or the given durations), without
+        decoding. Files are
+        grouped by int(log2(duration)) (<2s, 2-4s, 4-8s, ...) and each group is
+        cut into batches in duration order, so a batch never mixes clips
+        from different groups.
+        """
+        if durations is None:
+            durations = cls._audio_durations(audio_files)
+        buckets: Dict[int, List[Tuple[float, str]]] = {}
+        for audio_file in audio_files:
+            duration = durations[audio_file]
+            buckets.setdefault(int(np.log2(max(duration, 1.0))), []).append(
+                (duration, audio_file))
+        
+        batches = []
+        for bucket in sorted(buckets):
+            files = [f for _, f in sorted(buckets[bucket], key=lambda item: item[0])]
+            batches.extend(files[i:i + batch_size] for i in range(0, len(files), batch_size))
+        return batches
+    
+    def _process_in_batches(self, audio_files: List[str], batch_size: int,
+                            results: List[Dict], workers: int = 1,
+                            durations: Optional[Dict[str, float]] = None) -> Tuple[int, int]:
+        """
+        Transcribe files in duration-bucketed batches; returns (successful, failed)
+        
+        With workers > 1 this runs as a pipeline: worker processes decode and
+        analyze the next batch while this process, which holds the only
+        Whisper model, transcribes the current one.
+        """
+        successful = 0
+        failed = 0
+        
+        # Similar-length clips in a batch waste less padding and decoding
+        batches = self._bucket_files_by_duration(audio_files, batch_size, durations)
+        
+        pool = None
+        if workers > 1 and batches:
+            pool = self._analysis_pool(workers)
+        
+        def submit(batch):
+            # Analyses of at most two batches (and their signals) are in flight
+            return [pool.submit(_analyze_in_worker, f, True, self._durations.get(f))
+                    for f in batch]
+        
+        try:
+            upcoming = submit(batches[0]) if pool else None
+            for n, batch in enumerate(batches, 1):
+                current = upcoming
+                if pool and n < len(batches):
+                    upcoming = submit(batches[n])
+                
+                print_detail(f"\n{BAR}")
+                print_detail(f"📦 BATCH {n}/{len(batches)} ({len(batch)} files)")
+                print_detail(f"{BAR}")
+                
+                analyzed = None
+                paths = batch
+                if current is not None:
+                    # A file whose analysis failed is dropped from the batch
+                    analyzed = []
+                    paths = []
+                    for audio_file, future in zip(batch, current):
+                        try:
+                            analyzed.append(future.result())
+                        except Exception as e:
+                            failed += 1
+                            self._record_error(audio_file, e)
+                            continue
+                        paths.append(audio_file)
+                
+                batch_results, batch_failed = self.process_batch(paths, analyzed)
+                results.extend(batch_results)
+                successful += len(batch_results)
+                failed += batch_failed
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+        
+        return successful, failed
+
+
+# Marker line the server writes after each job so the launcher can tell
+# job results apart from regular progress output
+SERVER_RESULT_MARKER = "@@THAI_STT_RESULT@@"
+
+
+# Audio analyzer of a process_parallel worker process
+_worker_analyzer: Optional[AudioAnalyzer] = None
+
+
+def _init_analysis_worker(sample_rate: int, feature_rate: Optional[int],
+                          verbosity: int = NORMAL, cache_dir: Optional[str] = None,
+                          threads: Optional[int] = None):
+    """
+    Set up the audio analyzer of a process_parallel worker, limiting its
+    native thread pools to threads (when threadpoolctl is installed)
+    """
+    global _worker_analyzer
+    set_verbosity(verbosity)
+    if threads and THREADPOOLCTL_AVAILABLE:
+        threadpool_limits(threads)
+    _worker_analyzer = AudioAnalyzer(sample_rate=sample_rate, feature_rate=feature_rate,
+                                     cache_dir=cache_dir)
+
+
+def _analyze_in_worker(audio_path: str, keep_audio: bool = False,
+                       duration: Optional[float] = None) -> Tuple[Dict, Dict]:
+    """Analyze one file in a worker, returning (audio analysis, timings)"""
+    timings = {}
+    return _worker_analyzer.analyze_file(audio_path, timings, keep_audio, duration), timings
+
+
+def process_files(tagger: ThaiSTTAutoTagger, input_dir: str, filenames: List[str],
+                  enable_transcription: bool = True, batch_size: int = 1,
+                  workers: Optional[int] = None) -> int:
+    """
+    Process the named files from input_dir, returning the number of failures
+    
+    workers defaults to tagger.default_workers()
+    """
+    if workers is None:
+        workers = tagger.default_workers(enable_transcription)
+    failed = 0
+    file_paths = []
+    for filename in filenames:
+        file_path = Path(input_dir) / filename
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}")
+            failed += 1
+            continue
+        file_paths.append(str(file_path))
+    
+    # Metadata of multiple files is written in the background
+    if len(file_paths) > 1:
+        tagger._start_background_writes()
+    try:
+        if batch_size > 1 and enable_transcription and WHISPER_AVAILABLE:
+            failed += tagger._process_in_batches(file_paths, batch_size, [], workers)[1]
+        elif workers > 1 and len(file_paths) > 1:
+            failed += tagger.process_parallel(file_paths, enable_transcription, workers)[1]
+        elif enable_transcription and WHISPER_AVAILABLE and len(file_paths) > 1:
+            failed += tagger.process_overlapped(file_paths)[1]
+        else:
+            for file_path in file_paths:
+                try:
+                    tagger.process_file(file_path, enable_transcription)
+                except Exception as e:
+                    failed += 1
+                    tagger._record_error(file_path, e)
+    finally:
+        failed += tagger._finish_background_writes()
+        tagger._save_errors()
+    
+    return failed
+
+
+def serve():
+    """
+    Run as a persistent worker for the launcher
+    
+    Reads one JSON job per line from stdin and keeps taggers (and their
+    Whisper models) loaded between jobs. Progress output is written as
+    usual; each job ends with a SERVER_RESULT_MARKER line holding the result.
+    """
+    sys.stdout.reconfigure(line_buffering=True)
+    taggers = {}
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        ok = False
+        try:
+            job = json.loads(line)
+            enable_transcription = not job.get('no_transcription', False)
+            model = job.get('whisper_model', 'medium')
+            compute_type = job.get('compute_type', 'auto')
+            vad_filter = job.get('vad_filter', False)
+            # Audio-only jobs share one tagger that never loads a model
+            key = (model, compute_type, vad_filter) if enable_transcription else None
+            if key not in taggers:
+                taggers[key] = ThaiSTTAutoTagger(
+                    whisper_model=model, sample_rate=16000, compute_type=compute_type,
+                    vad_filter=vad_filter, enable_transcription=enable_transcription
+                )
+            tagger = taggers[key]
+            
+            tagger.audio_analyzer.feature_rate = job.get('feature_rate')
+            tagger.metadata_generator.output_dir = Path(job.get('output', 'metadata'))
+            tagger.metadata_generator.output_dir.mkdir(parents=True, exist_ok=True)
+            
+            if job.get('files'):
+                ok = process_files(tagger, job['input'], job['files'],
+                                   enable_transcription, job.get('batch_size', 1),
+                                   job.get('workers', 1)) == 0
+            else:
+                tagger.process_directory(
+                    job['input'],
+                    pattern=job.get('pattern', '*.mp3'),
+                    enable_transcription=enable_transcription,
+                    batch_size=job.get('batch_size', 1),
+                    workers=job.get('workers', 1)
+                )
+                ok = True
+        except Exception as e:
+            print(f"\n❌ ERROR running job: {e}")
+            traceback.print_exc()
+        
+        print(f"{SERVER_RESULT_MARKER} {json.dumps({'ok': ok})}")
 
 
 def main():
@@ -862,12 +2300,12 @@ def main():
     )
     parser.add_argument(
         '--input', '-i',
-        required=True,
-        help='Input directory containing audio files'
+        help='Input directory containing audio files (required unless --server or --download-model)'
     )
     parser.add_argument(
         '--file', '-f',
-        help='Process single file (optional)'
+        nargs='+',
+        help='Process one or more files from the input directory (optional)'
     )
     parser.add_argument(
         '--all', '-a',
@@ -890,18 +2328,104 @@ def main():
         choices=['tiny', 'base', 'small', 'medium', 'large'],
         help='Whisper model size (default: medium)'
     )
+    parser.add_argument(
+        '--compute-type',
+        default='auto',
+        choices=COMPUTE_TYPES,
+        help='Whisper compute type; int8 variants need faster-whisper '
+             '(default: auto = int8_float16 on GPU and int8 on CPU with faster-whisper, '
+             'float16 on GPU and float32 on CPU with openai-whisper)'
+    )
+    parser.add_argument(
+        '--vad-filter',
+        action='store_true',
+        help='With faster-whisper, skip audio its voice activity detector classifies '
+             'as non-speech (faster; transcripts and segment times can differ)'
+    )
+    parser.add_argument(
+        '--feature-rate',
+        type=int,
+        help='Compute acoustic features on audio resampled to this rate, e.g. 8000 '
+             '(faster; feature values differ from full-rate analysis)'
+    )
+    parser.add_argument(
+        '--audio-cache',
+        nargs='?',
+        const=str(DEFAULT_AUDIO_CACHE),
+        metavar='DIR',
+        help='Keep decoded audio in DIR (default: %(const)s) and reuse it on later '
+             'runs over unchanged files; uses about 230 MB per hour of audio'
+    )
     parser.add_argument(
         '--pattern',
         default='*.mp3',
         help='File pattern to match (default: *.mp3)'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1,
+        help='Transcribe files in batches of this size (default: 1)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Analyze audio in this many processes; transcription stays in one '
+             '(default: CPU count - 1 without transcription, 2 with GPU '
+             'transcription, 1 with CPU transcription)'
+    )
+    parser.add_argument(
+        '--download-model',
+        action='store_true',
+        help='Download the selected Whisper model into the cache and exit'
+    )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Run as a persistent worker reading JSON jobs from stdin'
+    )
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Print one line per file instead of step-by-step progress'
+    )
+    output_group.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Also print tracebacks of failed files and per-stage timing percentiles for the run'
+    )
     
     args = parser.parse_args()
+    if args.quiet:
+        set_verbosity(QUIET)
+    elif args.verbose:
+        set_verbosity(VERBOSE)
+    
+    if args.server:
+        serve()
+        return
+    
+    if args.download_model:
+        if not WHISPER_AVAILABLE:
+            print("Error: whisper is not installed")
+            sys.exit(1)
+        SpeechTranscriber(model_name=args.whisper_model, compute_type=args.compute_type)
+        return
+    
+    if not args.input:
+        parser.error("--input is required")
     
     # Initialize tagger
     tagger = ThaiSTTAutoTagger(
         whisper_model=args.whisper_model,
-        sample_rate=16000
+        sample_rate=16000,
+        compute_type=args.compute_type,
+        feature_rate=args.feature_rate,
+        audio_cache_dir=args.audio_cache,
+        vad_filter=args.vad_filter,
+        enable_transcription=not args.no_transcription
     )
     
     # Update output directory
@@ -912,20 +2436,19 @@ def main():
     
     # Process files
     if args.file:
-        # Process single file
-        file_path = Path(args.input) / args.file
-        if not file_path.exists():
-            print(f"Error: File not found: {file_path}")
-            return
-        
-        tagger.process_file(str(file_path), enable_transcription)
+        # Process the listed files
+        if process_files(tagger, args.input, args.file, enable_transcription,
+                         args.batch_size, args.workers):
+            sys.exit(1)
     
     elif args.all:
         # Process all files
         tagger.process_directory(
             args.input,
             pattern=args.pattern,
-            enable_transcription=enable_transcription
+            enable_transcription=enable_transcription,
+            batch_size=args.batch_size,
+            workers=args.workers
         )
     
     else: